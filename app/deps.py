@@ -2,15 +2,23 @@ from __future__ import annotations
 
 """ import sys uncomment while running in collab"""
 import os
+import pickle
+import threading
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from functools import lru_cache
 from pathlib import Path
 from typing import Dict
 
 import yaml
 from dotenv import load_dotenv
 
+try:  # pragma: no cover - libyaml is optional but ~10x faster
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader
+
 os.environ.setdefault("HF_HUB_DISABLE_PROGRESS_BARS", "1")
 os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
 
@@ -36,8 +44,38 @@ ROOT = Path(__file__).resolve().parent.parent
 def _load_yaml(path: Path) -> Dict:
     if not path.exists():
         return {}
-    with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+    stat = path.stat()
+    sidecar = path.with_suffix(path.suffix + ".pkl")
+    header = (stat.st_mtime_ns, stat.st_size)
+    cached = _read_precompiled(sidecar, header)
+    if cached is not None:
+        return cached
+    # Parse from a contiguous buffer so libyaml does not go through Python's
+    # buffered file wrapper one read at a time.
+    parsed = yaml.load(path.read_bytes(), Loader=_YamlLoader) or {}
+    _write_precompiled(sidecar, header, parsed)
+    return parsed
+
+
+def _read_precompiled(sidecar: Path, header: tuple[int, int]) -> Dict | None:
+    """Return the cached parse when the sidecar matches the source mtime+size."""
+    try:
+        stored_header, payload = pickle.loads(sidecar.read_bytes())
+    except Exception:
+        return None
+    if stored_header != header:
+        return None
+    return payload
+
+
+def _write_precompiled(sidecar: Path, header: tuple[int, int], payload: Dict) -> None:
+    """Atomically persist a parsed config next to its YAML source (best effort)."""
+    try:
+        tmp = sidecar.with_suffix(sidecar.suffix + ".tmp")
+        tmp.write_bytes(pickle.dumps((header, payload), protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, sidecar)
+    except OSError:
+        pass
 
 
 @dataclass
@@ -52,16 +90,47 @@ class AppState:
     controller: DHQCController
     reranker: CEReranker
     policy_version: str
-    policy_applied_keys: set[str] = field(default_factory=set)
+    # Bounded LRU of seen idempotency keys (value is always None); an
+    # OrderedDict keeps long-running servers from leaking one entry per
+    # unique client key.
+    policy_applied_keys: OrderedDict[str, None] = field(default_factory=OrderedDict)
+
+
+# Bound once by _init_state(); read directly by the get_* accessors below so
+# hot endpoints skip the lru_cache hash + wrapper call on every dependency
+# resolution.
+_STATE: AppState | None = None
+_STATE_LOCK = threading.Lock()
 
 
-@lru_cache(maxsize=1)
 def get_app_state() -> AppState:
+    state = _STATE
+    if state is not None:
+        return state
+    return _init_state()
+
+
+def _init_state() -> AppState:
+    global _STATE
+    with _STATE_LOCK:
+        if _STATE is not None:
+            return _STATE
+        _STATE = _build_state()
+        return _STATE
+
+
+def _build_state() -> AppState:
     load_dotenv(ROOT / ".env")
-    models_cfg = _load_yaml(ROOT / "config" / "models.yaml")
-    policy_cfg = _load_yaml(ROOT / "config" / "polar.yaml")
-    axis_cfg = _load_yaml(ROOT / "config" / "axis_policy.yaml")
-    tenant_cfg = _load_yaml(ROOT / "config" / "tenants" / "default.yaml")
+    # Load the four configs concurrently: libyaml releases the GIL while
+    # parsing and the reads are I/O-bound, so threads overlap nicely.
+    config_paths = [
+        ROOT / "config" / "models.yaml",
+        ROOT / "config" / "polar.yaml",
+        ROOT / "config" / "axis_policy.yaml",
+        ROOT / "config" / "tenants" / "default.yaml",
+    ]
+    with ThreadPoolExecutor(max_workers=len(config_paths)) as pool:
+        models_cfg, policy_cfg, axis_cfg, tenant_cfg = list(pool.map(_load_yaml, config_paths))
 
     pvdb = PVDB(models_cfg, persist_path=ROOT / "storage" / "pvdb" / "persisted.json")
     cache = CacheClient(os.getenv("REDIS_URL"))
@@ -90,14 +159,25 @@ def get_policy_cfg() -> Dict:
     return get_app_state().policy_cfg
 
 
+_POLICY_KEYS_MAX = 10_000
+
+
 def set_policy_cfg(new_policy: Dict, version: str, idempotency_key: str | None = None) -> None:
     state = get_app_state()
     if idempotency_key and idempotency_key in state.policy_applied_keys:
+        state.policy_applied_keys.move_to_end(idempotency_key)
         return
     state.policy_cfg.update(new_policy)
     state.policy_version = version
     if idempotency_key:
-        state.policy_applied_keys.add(idempotency_key)
+        state.policy_applied_keys[idempotency_key] = None
+        while len(state.policy_applied_keys) > _POLICY_KEYS_MAX:
+            state.policy_applied_keys.popitem(last=False)
+
+    # New policy must invalidate memoized answers immediately.
+    from app.services.answer_service import clear_answer_cache  # noqa: WPS433
+
+    clear_answer_cache()
 
 
 def get_pvdb() -> PVDB:
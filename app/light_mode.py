@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def light_mode_enabled() -> bool:
     """
     Return True when ChronoRAG should avoid heavy model initialization.
 
     Defaults to True whenever tests are running (detected via PYTEST_CURRENT_TEST)
     unless explicitly disabled via CHRONORAG_LIGHT=0/false/no.
+
+    The result is cached for the life of the process: both variables are set
+    before any app code runs, and this helper is called throughout the hot
+    retrieval path.
     """
     val = os.getenv("CHRONORAG_LIGHT", "").strip().lower()
     if val in ("0", "false", "no"):
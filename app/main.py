@@ -1,14 +1,59 @@
 from __future__ import annotations
 
+import os
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from starlette.responses import Response
+
+# Pre-encoded health payload: probes can hit this at high QPS, so skip
+# per-call dict allocation and JSON encoding entirely.
+_HEALTHZ_BODY = b'{"status":"ok"}'
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="ChronoRAG API", version="0.1.0")
+    # orjson serializes the nested answer/retrieve payloads several times
+    # faster than stdlib json and handles datetimes natively.
+    app = FastAPI(title="ChronoRAG API", version="0.1.0", default_response_class=ORJSONResponse)
+
+    @app.on_event("startup")
+    async def _size_threadpool() -> None:
+        # CPU-bound endpoints run via run_in_threadpool; cap the shared
+        # threadpool so concurrent answer/retrieve calls don't starve it.
+        import anyio.to_thread
+
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = int(os.getenv("CHRONORAG_THREADPOOL_SIZE", limiter.total_tokens))
+
+    @app.on_event("startup")
+    async def _warm_state() -> None:
+        # Warm the app state (configs, PVDB, reranker) in the background so
+        # the port binds immediately; light mode skips heavy init entirely.
+        from app.light_mode import light_mode_enabled  # noqa: WPS433
+
+        if light_mode_enabled():
+            return
+        import asyncio
+
+        from app.deps import get_app_state, get_models_cfg  # noqa: WPS433
+
+        def _warm() -> None:
+            get_app_state()
+            # Pre-select (and memoize) the LLM backend so the first query
+            # doesn't pay framework imports or model weight loading.
+            try:
+                from core.generator.llm_loader import load_backend  # noqa: WPS433
+
+                load_backend(get_models_cfg().get("llm", {}))
+            except Exception:
+                pass
+
+        loop = asyncio.get_running_loop()
+        loop.run_in_executor(None, _warm)
 
     @app.get("/healthz")
-    def healthz() -> dict:
-        return {"status": "ok"}
+    async def healthz() -> Response:
+        return Response(content=_HEALTHZ_BODY, media_type="application/json")
 
     from app.routes import answer, incident, ingest, policy, retrieve  # noqa: WPS433
 
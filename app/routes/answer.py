@@ -1,19 +1,64 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
 
 from app.schemas.answer import AnswerRequest, AnswerResponse
-from app.services.answer_service import answer
 
 router = APIRouter()
 
+# Built at import time so the first request does not pay TypeAdapter
+# construction, and the handler validates raw bytes directly instead of going
+# through FastAPI's per-request model machinery.
+_REQUEST_ADAPTER: TypeAdapter[AnswerRequest] = TypeAdapter(AnswerRequest)
+_RESPONSE_ADAPTER: TypeAdapter[AnswerResponse] = TypeAdapter(AnswerResponse)
+
 
 @router.post("/answer", response_model=AnswerResponse)
-def answer_endpoint(payload: AnswerRequest) -> AnswerResponse:
-    response = answer(
+async def answer_endpoint(request: Request) -> Response:
+    # Imported lazily so building the app does not drag in the generator
+    # stack (torch/transformers) before the port is bound.
+    from app.services.answer_service import answer  # noqa: WPS433
+
+    try:
+        payload = _REQUEST_ADAPTER.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
+    if payload.stream:
+        return StreamingResponse(_answer_frames(answer, payload), media_type="application/x-ndjson")
+
+    # Retrieval + rerank + generation hold the GIL for long stretches; run
+    # them on the threadpool so the event loop keeps serving other requests.
+    response = await run_in_threadpool(
+        answer,
+        query=payload.query,
+        time_hint=payload.time_hint,
+        requested_mode=payload.time_mode.value,
+        requested_axis=payload.time_axis.value,
+    )
+    # The service layer produces well-typed payloads, so skip Pydantic
+    # re-validation on the way out (equivalence is covered by tests).
+    body = _RESPONSE_ADAPTER.dump_json(AnswerResponse.model_construct(**response), warnings=False)
+    return Response(content=body, media_type="application/json")
+
+
+async def _answer_frames(answer, payload: AnswerRequest):
+    """Yield NDJSON frames: the answer text first, then the attribution frame.
+
+    The client can render the narrative as soon as the generator finishes and
+    cancel the connection before the (larger) metadata frame is sent.
+    """
+    response = await run_in_threadpool(
+        answer,
         query=payload.query,
         time_hint=payload.time_hint,
         requested_mode=payload.time_mode.value,
         requested_axis=payload.time_axis.value,
     )
-    return AnswerResponse(**response)
+    yield orjson.dumps({"answer": response["answer"]}) + b"\n"
+    tail = {key: value for key, value in response.items() if key != "answer"}
+    yield orjson.dumps(tail) + b"\n"
@@ -1,23 +1,48 @@
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
 
-from app.deps import get_router
 from app.schemas.retrieve import RetrieveRequest, RetrieveResponse
-from app.services.retrieve_service import retrieve
 
 router = APIRouter()
 
+# Import-time TypeAdapters keep validation cost off the first request and let
+# the handler bypass FastAPI's per-request model machinery.
+_REQUEST_ADAPTER: TypeAdapter[RetrieveRequest] = TypeAdapter(RetrieveRequest)
+_RESPONSE_ADAPTER: TypeAdapter[RetrieveResponse] = TypeAdapter(RetrieveResponse)
+
 
 @router.post("/retrieve", response_model=RetrieveResponse)
-def retrieve_endpoint(payload: RetrieveRequest) -> RetrieveResponse:
+async def retrieve_endpoint(request: Request) -> Response:
+    # Lazy imports keep heavy retrieval dependencies out of app build time.
+    from app.deps import get_router  # noqa: WPS433
+    from app.services.retrieve_service import retrieve  # noqa: WPS433
+
+    try:
+        payload = _REQUEST_ADAPTER.validate_json(await request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
     decision = get_router().route(payload.query, payload.time_hint, signals=None)
     window = decision.window
-    data = retrieve(
+    # Embedding + rerank work is CPU-bound; keep it off the event loop.
+    data = await run_in_threadpool(
+        retrieve,
         payload.query,
         window,
         payload.time_mode.value,
         payload.top_k,
         axis=payload.time_axis.value,
     )
-    return RetrieveResponse(query=payload.query, results=data["results"])
+    # Results carry TimeWindow objects internally; serialize them to the
+    # wire {from, to} form only here at the boundary.
+    from app.utils.cards import window_to_payload  # noqa: WPS433
+
+    for item in data["results"]:
+        item["valid_window"] = window_to_payload(item["valid_window"])
+    # Internal retrieval output is already well-typed; model_construct skips
+    # a second full validation pass before serialization.
+    response = RetrieveResponse.model_construct(query=payload.query, results=data["results"])
+    return Response(content=_RESPONSE_ADAPTER.dump_json(response, warnings=False), media_type="application/json")
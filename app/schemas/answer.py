@@ -48,6 +48,7 @@ class AnswerRequest(BaseModel):
     constraints: Dict[str, int] = Field(default_factory=dict)
     retrieval: Dict[str, float] = Field(default_factory=dict)
     audit_mode: bool = False
+    stream: bool = False
 
 
 class AnswerResponse(BaseModel):
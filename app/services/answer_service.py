@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import datetime as dt
+import json
 import time
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
 from app.deps import (
+    get_app_state,
     get_controller,
     get_models_cfg,
     get_policy_cfg,
@@ -17,25 +19,47 @@ from app.utils.cards import build_attribution_card
 from app.utils.chrono_reducer import (
     ChronoConflict,
     ChronoPassage,
+    analyze_passages,
     build_dual_timelines,
-    detect_conflicts,
-    reduce_passages,
 )
 from app.utils.time_windows import TimeWindow, window_iou
 from core.dhqc.signals import RetrievalSignals
-from core.generator.generate import generate_answer
+from core.generator.generate import clear_generation_cache, generate_answer
+
+# Per-domain retrieval fan-out; policy may override via retrieval_top_k_by_domain.
+_TOP_K_BY_DOMAIN: Dict[str, int] = {"world-economy": 60}
+_DEFAULT_TOP_K = 6
 
 
-def _dict_to_window(payload: Dict[str, str]) -> TimeWindow:
-    """Convert a serialized window dictionary back into a TimeWindow instance."""
-    return TimeWindow(
-        start=dt.datetime.fromisoformat(payload["from"]),
-        end=dt.datetime.fromisoformat(payload["to"]),
-    )
 
 
 def answer(query: str, time_hint: Dict | None, requested_mode: str, requested_axis: str) -> Dict:
-    """Main entry point used by CLI/API to produce a final answer payload."""
+    """Main entry point used by CLI/API to produce a final answer payload.
+
+    Results are memoized in a bounded LRU keyed on the full request tuple plus
+    the active policy version; repeat queries skip retrieval and generation
+    entirely.  The cache is cleared whenever policy changes or new documents
+    are ingested.
+    """
+    hint_key = json.dumps(time_hint, sort_keys=True) if time_hint else None
+    return _answer_cached(get_app_state().policy_version, query, hint_key, requested_mode, requested_axis)
+
+
+def clear_answer_cache() -> None:
+    """Drop memoized answers after policy updates or fresh ingests."""
+    _answer_cached.cache_clear()
+    clear_generation_cache()
+
+
+@lru_cache(maxsize=512)
+def _answer_cached(
+    policy_version: str,
+    query: str,
+    time_hint_json: str | None,
+    requested_mode: str,
+    requested_axis: str,
+) -> Dict:
+    time_hint = json.loads(time_hint_json) if time_hint_json else None
     router = get_router()
     controller = get_controller()
     models_cfg = get_models_cfg()
@@ -47,7 +71,8 @@ def answer(query: str, time_hint: Dict | None, requested_mode: str, requested_ax
     window: TimeWindow = decision.window
     domain = decision.domain
     window_kind = decision.window_kind
-    retrieval_top_k = 60 if domain == "world-economy" else 6
+    top_k_overrides = policy_cfg.get("retrieval_top_k_by_domain", _TOP_K_BY_DOMAIN)
+    retrieval_top_k = top_k_overrides.get(domain, _TOP_K_BY_DOMAIN.get(domain, _DEFAULT_TOP_K))
 
     start = time.time()
     retrieval = retrieve(query, window, mode, top_k=retrieval_top_k, axis=axis, domain=domain)
@@ -58,35 +83,42 @@ def answer(query: str, time_hint: Dict | None, requested_mode: str, requested_ax
     coverage = metadata.get("coverage_fraction")
     if coverage is None:
         coverage = min(1.0, len(results) / max(1.0, float(retrieval_top_k)))
+    # A list comprehension plus plain max keeps the reduction in one tight C
+    # loop rather than driving the generator protocol per item.
+    authorities = [item["authority"] for item in results]
     signals = RetrievalSignals(
         coverage=coverage,
-        authority=max((item["authority"] for item in results), default=0.0),
+        authority=max(authorities) if authorities else 0.0,
     )
     plan = controller.plan(mode, signals)
     hops_used = metadata.get("hops_executed", 1)
     hop_shortfall = plan.hops > hops_used
+    # Computed once here and reused by both the evidence-only and generated
+    # branches below.
+    tokens_in = len(query.split())
 
+    # Positional construction: kwarg binding costs add up across the wide
+    # world-economy fan-out, and retrieve() always populates these keys.
     passages: List[ChronoPassage] = [
         ChronoPassage(
-            chunk_id=item["chunk_id"],
-            doc_id=item["doc_id"],
-            text=item["text"],
-            uri=item["uri"],
-            valid_window=_dict_to_window(item["valid_window"]),
-            authority=item["authority"],
-            score=item["final_score"],
-            facets=item.get("facets", {}),
-            entities=item.get("entities", []),
-            units=item.get("units_detected", []),
-            region=item.get("region"),
+            item["chunk_id"],
+            item["doc_id"],
+            item["text"],
+            item["uri"],
+            item["valid_window"],
+            item["authority"],
+            item["final_score"],
+            item["facets"],
+            item["entities"],
+            item["units_detected"],
+            item["region"],
         )
         for item in results
     ]
 
-    reduced = reduce_passages(passages)
     chronosanity_cfg = policy_cfg.get("chronosanity", {})
     chrono_threshold = chronosanity_cfg.get("overlap_threshold", 0.6)
-    conflicts = detect_conflicts(reduced, threshold=chrono_threshold)
+    reduced, conflicts = analyze_passages(passages, threshold=chrono_threshold)
     counterfactuals = None
     audit_trail = []
     chronosanity_warn = False
@@ -111,24 +143,19 @@ def answer(query: str, time_hint: Dict | None, requested_mode: str, requested_ax
                 "alternative_windows": _alternative_windows(results, window),
             }
             card = build_attribution_card(reduced, mode, axis, window, confidence, counterfactuals=counterfactuals)
-            degraded_flag = "CHRONO_SANITY"
-            if hop_shortfall:
-                degraded_flag = f"{degraded_flag}|HOP_SHORTFALL"
-            controller_stats = {
-                "hops_used": hops_used,
-                "hop_plan": {"planned": plan.hops, "executed": hops_used, "reason": plan.reason},
-                "hop_shortfall": hop_shortfall,
-                "signals": signals.to_dict(),
-                "latency_ms": retrieval_time,
-                "time_window_kind": window_kind,
-                "cost_usd": 0.0,
-                "tokens_in": len(query.split()),
-                "tokens_out": 0,
-                "degraded": degraded_flag,
-                "rerank_method": "ce",
-                "retrieval_weights": retrieval.get("weights_used"),
-                "router_metrics": getattr(router, "observability", {}),
-            }
+            controller_stats = _build_controller_stats(
+                plan,
+                hops_used,
+                hop_shortfall,
+                signals,
+                retrieval_time,
+                window_kind,
+                tokens_in,
+                tokens_out=0,
+                degraded="CHRONO_SANITY",
+                retrieval=retrieval,
+                router=router,
+            )
             return {
                 "answer": "",
                 "attribution_card": card,
@@ -150,14 +177,49 @@ def answer(query: str, time_hint: Dict | None, requested_mode: str, requested_ax
     if chronosanity_warn:
         confidence["level"] = "MEDIUM" if confidence["level"] == "HIGH" else confidence["level"]
         confidence["reasons"].append("chronosanity_overlap")
-    card = build_attribution_card(reduced, mode, axis, window, confidence)
-    if counterfactuals:
-        card = build_attribution_card(reduced, mode, axis, window, confidence, counterfactuals=counterfactuals)
+    card = build_attribution_card(reduced, mode, axis, window, confidence, counterfactuals=counterfactuals)
 
-    degraded_flag = "CHRONO_SANITY_WARN" if chronosanity_warn else None
+    controller_stats = _build_controller_stats(
+        plan,
+        hops_used,
+        hop_shortfall,
+        signals,
+        retrieval_time,
+        window_kind,
+        tokens_in,
+        tokens_out=tokens_out,
+        degraded="CHRONO_SANITY_WARN" if chronosanity_warn else None,
+        retrieval=retrieval,
+        router=router,
+    )
+
+    return {
+        "answer": generated_text,
+        "attribution_card": card,
+        "controller_stats": controller_stats,
+        "audit_trail": audit_trail,
+        "evidence_only": False,
+        "reason": None,
+    }
+
+
+def _build_controller_stats(
+    plan,
+    hops_used: int,
+    hop_shortfall: bool,
+    signals: RetrievalSignals,
+    retrieval_time: int,
+    window_kind: str,
+    tokens_in: int,
+    tokens_out: int,
+    degraded: str | None,
+    retrieval: Dict,
+    router,
+) -> Dict:
+    """Assemble the controller_stats payload shared by both answer branches."""
     if hop_shortfall:
-        degraded_flag = f"{degraded_flag}|HOP_SHORTFALL" if degraded_flag else "HOP_SHORTFALL"
-    controller_stats = {
+        degraded = f"{degraded}|HOP_SHORTFALL" if degraded else "HOP_SHORTFALL"
+    return {
         "hops_used": hops_used,
         "hop_plan": {"planned": plan.hops, "executed": hops_used, "reason": plan.reason},
         "hop_shortfall": hop_shortfall,
@@ -165,35 +227,22 @@ def answer(query: str, time_hint: Dict | None, requested_mode: str, requested_ax
         "latency_ms": retrieval_time,
         "time_window_kind": window_kind,
         "cost_usd": 0.0,
-        "tokens_in": len(query.split()),
+        "tokens_in": tokens_in,
         "tokens_out": tokens_out,
-        "degraded": degraded_flag,
+        "degraded": degraded,
         "rerank_method": "ce",
         "retrieval_weights": retrieval.get("weights_used"),
         "router_metrics": getattr(router, "observability", {}),
     }
 
-    return {
-        "answer": generated_text,
-        "attribution_card": card,
-        "controller_stats": controller_stats,
-        "audit_trail": audit_trail,
-        "evidence_only": False,
-        "reason": None,
-    }
-
 
 def _alternative_windows(results: List[Dict], query_window: TimeWindow) -> List[str]:
     """Suggest alternative windows when supporting evidence falls outside the query."""
     alternatives: List[str] = []
     for item in results:
-        interval = item.get("valid_window", {})
-        if not interval:
+        candidate = item.get("valid_window")
+        if candidate is None:
             continue
-        candidate = TimeWindow(
-            start=dt.datetime.fromisoformat(interval["from"]),
-            end=dt.datetime.fromisoformat(interval["to"]),
-        )
         if window_iou(candidate, query_window) > 0:
             continue
         label = f"{candidate.start.date()} → {candidate.end.date()}"
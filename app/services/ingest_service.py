@@ -10,19 +10,16 @@ instead closing tx windows and writing fresh rows.
 from __future__ import annotations
 
 import datetime as dt
-import json
-import math
 import os
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import orjson
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
-try:  # pragma: no cover - optional dependency
-    import torch
-except Exception:  # pragma: no cover
-    torch = None
-
 from app.deps import get_cache, get_policy_cfg, get_pvdb
 from app.utils.time_windows import TimeWindow, make_window, parse_date
 from core.gsm.source_risk import score_source
@@ -78,168 +75,234 @@ REGION_KEYWORDS: Dict[str, str] = {
     "post-war": "Post-war",
 }
 
-# Unit detection helps nudge the reranker toward numeric passages.
-UNIT_PATTERNS: Dict[str, Tuple[re.Pattern, ...]] = {
-    "intl_1990_usd": (
-        re.compile(r"1990\\s+international\\s+dollars", re.IGNORECASE),
-        re.compile(r"1990\\s+intl\\.?\\s*usd", re.IGNORECASE),
-    ),
-    "percent": (
-        re.compile(r"%"),
-        re.compile(r"percent", re.IGNORECASE),
-    ),
-    "ratio": (
-        re.compile(r"ratio", re.IGNORECASE),
-        re.compile(r"per\\s+capita", re.IGNORECASE),
-    ),
+# Unit detection helps nudge the reranker toward numeric passages.  All unit
+# alternatives are fused into one named-group regex so detection is a single
+# linear scan over the text instead of one scan per pattern.
+UNIT_PATTERNS: Dict[str, str] = {
+    "intl_1990_usd": r"1990\s+international\s+dollars|1990\s+intl\.?\s*usd",
+    "percent": r"%|percent",
+    "ratio": r"ratio|per\s+capita",
 }
+_UNITS_RE = re.compile(
+    "|".join(f"(?P<{label}>{alternatives})" for label, alternatives in UNIT_PATTERNS.items()),
+    re.IGNORECASE,
+)
+
+# One lookahead-wrapped alternation finds every COUNTRY/REGION keyword in a
+# single linear pass over the haystack (the lookahead keeps overlapping hits
+# like "western europe" + "europe", matching the old per-phrase scans).
+_ENTITY_KEYWORDS: Dict[str, str] = {
+    **{phrase: f"Country:{iso}" for phrase, iso in COUNTRY_KEYWORDS.items()},
+    **{phrase: f"Region:{region}" for phrase, region in REGION_KEYWORDS.items()},
+}
+_ENTITY_SCAN = re.compile(
+    "(?=("
+    + "|".join(re.escape(phrase) for phrase in sorted(_ENTITY_KEYWORDS, key=len, reverse=True))
+    + "))"
+)
+
+# Used to sniff the first non-whitespace character of an ingest payload.
+_FIRST_NONSPACE = re.compile(r"\S")
+_FIRST_NONSPACE_BYTES = re.compile(rb"\S")
+
+# Fixed window bounds reused across every record; parsing these literals per
+# row was a measurable share of ingest time.
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+_MAX_END = dt.datetime(9999, 12, 31, tzinfo=dt.timezone.utc)
+
+
+@lru_cache(maxsize=512)
+def _year_end(year: int) -> dt.datetime:
+    """Return the first instant of the following year (closed-open year window)."""
+    return dt.datetime(year + 1, 1, 1, tzinfo=dt.timezone.utc)
 
-GPU_BATCHING_ENABLED = bool(torch and torch.cuda.is_available())
 if os.environ.get("KAGGLE_KERNEL_RUN_TYPE"):
     os.environ.setdefault("SENTENCE_TRANSFORMERS_HOME", "/kaggle/working/.cache")
     os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
-    if torch and torch.cuda.is_available():
-        os.environ.setdefault("CUDA_VISIBLE_DEVICES", "0")
 
-
-def _iter_batches(items: List[str]) -> Iterable[List[str]]:
-    """Yield items in up to four batches when CUDA is available; otherwise a single batch."""
-    if not GPU_BATCHING_ENABLED or len(items) <= 1:
-        if items:
-            yield items
-        return
-    desired_batches = min(4, len(items))
-    chunk_size = max(1, math.ceil(len(items) / desired_batches))
-    for idx in range(0, len(items), chunk_size):
-        yield items[idx : idx + chunk_size]
+# Parsing fans out to worker processes once an ingest covers this many
+# payloads; below it the pool spawn cost outweighs the parallel parse win.
+_PARALLEL_PARSE_MIN_PAYLOADS = 4
 
 
 def ingest(paths: List[str], text_blobs: List[str], provenance: str | None = None) -> List[str]:
     """Entry-point for CLI/API ingestion commands."""
     pvdb = get_pvdb()
     policy = get_policy_cfg()
-    ingested_ids: List[str] = []
-
-    # Ingest every file path.  Non-existent files are silently skipped so that
-    # bulk commands remain resilient to missing resources.
-    for batch in _iter_batches(paths):
-        for item in batch:
-            path = Path(item)
-            if not path.exists():
-                continue
-            text = path.read_text(encoding="utf-8")
-            uri = provenance or path.name
-            ingested_ids.extend(_process_payload(text, uri, pvdb, policy))
 
+    # Collect every payload up front.  Non-existent files are silently skipped
+    # so that bulk commands remain resilient to missing resources.  Files are
+    # read as raw bytes: orjson parses JSONL lines from bytes directly, so the
+    # UTF-8 decode only happens for payloads that fall back to plain text.
+    payloads: List[Tuple[str | bytes, str]] = []
+    for item in paths:
+        path = Path(item)
+        if not path.exists():
+            continue
+        payloads.append((path.read_bytes(), provenance or path.name))
     # Inline text blobs (e.g., pasted snippets) are treated like individual documents.
-    offset = 0
-    for batch in _iter_batches(text_blobs):
-        for text in batch:
-            uri = provenance or f"inline:{offset}"
-            ingested_ids.extend(_process_payload(text, uri, pvdb, policy))
-            offset += 1
-
-    # Flush disk persistence once per ingest batch to amortise I/O.
-    pvdb.flush()
-    return ingested_ids
+    for offset, text in enumerate(text_blobs):
+        payloads.append((text, provenance or f"inline:{offset}"))
+
+    # Parsing (JSON decode, regex entity/unit scans, window resolution) is
+    # CPU-bound pure Python, so large multi-file ingests parse in worker
+    # processes; storing stays on this thread because PVDB is not fork-safe.
+    if len(payloads) >= _PARALLEL_PARSE_MIN_PAYLOADS and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor() as executor:
+            parsed_lists = list(
+                executor.map(_parse_payload, [text for text, _ in payloads], [uri for _, uri in payloads])
+            )
+    else:
+        parsed_lists = [_parse_payload(text, uri) for text, uri in payloads]
 
+    # bulk_ingest defers per-chunk embedding so the whole batch goes through
+    # one model forward pass when the context drains.
+    ingested_ids: List[str] = []
+    with pvdb.bulk_ingest():
+        for prepared in parsed_lists:
+            ingested_ids.extend(_store_prepared(prepared, pvdb, policy))
 
-def _process_payload(text: str, default_uri: str, pvdb, policy: Dict) -> List[str]:
-    """Attempt to parse structured JSON lines, falling back to unstructured text."""
-    structured = _try_parse_structured(text)
-    if structured is not None:
-        return _ingest_structured(structured, default_uri, pvdb, policy)
-    return _ingest_unstructured(text, default_uri, pvdb, policy)
+    # Queue persistence on the background flusher so callers never block on
+    # disk I/O; it writes once enough bytes or time accumulate.
+    pvdb.request_flush(sum(len(text) for text, _ in payloads))
 
+    if ingested_ids:
+        # Fresh evidence invalidates any memoized answers.
+        from app.services.answer_service import clear_answer_cache  # noqa: WPS433
 
-def _try_parse_structured(text: str) -> Optional[List[Dict]]:
-    """Return a list of parsed JSON objects when every line is valid JSON."""
-    records: List[Dict] = []
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    if not lines:
-        return None
-    for line in lines:
-        try:
-            records.append(json.loads(line))
-        except json.JSONDecodeError:
-            return None
-    return records
+        clear_answer_cache()
+    return ingested_ids
 
 
-def _ingest_structured(records: List[Dict], default_uri: str, pvdb, policy: Dict) -> List[str]:
-    """Ingest Maddison-format structured rows."""
+def _parse_payload(text: str | bytes, default_uri: str) -> List[Dict]:
+    """Parse a raw payload into prepared records without touching the PVDB.
+
+    This is the pure, CPU-bound half of ingestion and therefore safe to run in
+    worker processes; `_store_prepared` applies the results on the main thread.
+    Accepts bytes (files) or str (inline blobs); bytes are only decoded when a
+    payload falls through to the unstructured path.
+    """
+    # JSON/JSONL payloads necessarily open with '{' or '['; sniffing the first
+    # non-whitespace character skips the full line-by-line parse attempt for
+    # plain-text blobs (without copying the blob the way lstrip() would).
+    if isinstance(text, bytes):
+        head_match = _FIRST_NONSPACE_BYTES.search(text)
+        openers: Tuple = (b"{", b"[")
+    else:
+        head_match = _FIRST_NONSPACE.search(text)
+        openers = ("{", "[")
+    if head_match and head_match.group(0) in openers:
+        structured = _try_parse_structured(text)
+        if structured is not None:
+            return [_prepare_structured(payload, default_uri) for payload in structured]
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+    return [_prepare_unstructured(text, default_uri)]
+
+
+def _store_prepared(prepared: List[Dict], pvdb, policy: Dict) -> List[str]:
+    """Apply prepared records to the PVDB and fire freshness probes."""
     ingested: List[str] = []
-    for payload in records:
-        text = payload.get("text")
-        facets = _merge_facets(payload.get("facets"), WORLD_FACET_DEFAULTS if _is_world_economy(payload) else {})
-        doc_id = payload.get("doc_id")
-        if not doc_id and facets.get("domain") == "world-economy":
-            doc_id = WORLD_ECONOMY_DOC_ID
-        if isinstance(text, str):
-            external_id = payload.get("external_id")
-            valid_window, time_granularity, time_sigma = _resolve_valid_window(payload, facets)
-            tx_window = _resolve_tx_window(payload.get("tx"), valid_window)
-            entities = _derive_entities(payload, facets)
-            units = _detect_units(text, facets)
-            raw_uri = (
-                payload.get("provenance", {}).get("uri")
-                or payload.get("uri")
-                or default_uri
-            )
-            source = score_source(raw_uri)
-            metadata = {
-                "uri": raw_uri,
-                "external_id": external_id,
-                "status": payload.get("status"),
-                "provenance": payload.get("provenance"),
-            }
-            record = pvdb.ingest_document(
-                text=text,
-                uri=raw_uri,
-                valid_window=valid_window,
-                tx_window=tx_window,
-                authority=source["authority"],
-                metadata=metadata,
-                doc_id=doc_id,
-                external_id=external_id,
-                version_id=_extract_version_id(payload),
-                facets=facets,
-                entities=entities,
-                tags=payload.get("tags"),
-                units=units,
-                time_granularity=time_granularity,
-                time_sigma_days=time_sigma,
-            )
-            ingested.append(record.chunk_id)
-            _apply_freshness_policy(policy, entities, raw_uri)
-        else:
-            _handle_ledger(payload, pvdb, doc_id or WORLD_ECONOMY_DOC_ID)
+    for item in prepared:
+        if item["kind"] == "ledger":
+            _handle_ledger(item["payload"], pvdb, item["doc_id"])
+            continue
+        kwargs = item["kwargs"]
+        record = pvdb.ingest_document(**kwargs)
+        ingested.append(record.chunk_id)
+        _apply_freshness_policy(policy, kwargs["entities"], kwargs["uri"])
     return ingested
 
 
-def _ingest_unstructured(text: str, uri: str, pvdb, policy: Dict) -> List[str]:
+def _try_parse_structured(text: str | bytes) -> Optional[List[Dict]]:
+    """Return a list of parsed JSON objects when every line is valid JSON.
+
+    Works on str and bytes alike; orjson parses bytes lines without an
+    intermediate decode.
+    """
+    records: List[Dict] = []
+    for raw in text.splitlines():
+        line = raw.strip()
+        if not line:
+            continue
+        try:
+            records.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            return None
+    return records or None
+
+
+def _prepare_structured(payload: Dict, default_uri: str) -> Dict:
+    """Derive everything a Maddison-format structured row needs before storage."""
+    text = payload.get("text")
+    facets = _merge_facets(payload.get("facets"), WORLD_FACET_DEFAULTS if _is_world_economy(payload) else {})
+    doc_id = payload.get("doc_id")
+    if not doc_id and facets.get("domain") == "world-economy":
+        doc_id = WORLD_ECONOMY_DOC_ID
+    if not isinstance(text, str):
+        return {"kind": "ledger", "payload": payload, "doc_id": doc_id or WORLD_ECONOMY_DOC_ID}
+    external_id = payload.get("external_id")
+    valid_window, time_granularity, time_sigma = _resolve_valid_window(payload, facets)
+    tx_window = _resolve_tx_window(payload.get("tx"), valid_window)
+    entities = _derive_entities(payload, facets)
+    units = _detect_units(text, facets)
+    raw_uri = (
+        payload.get("provenance", {}).get("uri")
+        or payload.get("uri")
+        or default_uri
+    )
+    source = score_source(raw_uri)
+    metadata = {
+        "uri": raw_uri,
+        "external_id": external_id,
+        "status": payload.get("status"),
+        "provenance": payload.get("provenance"),
+    }
+    return {
+        "kind": "chunk",
+        "kwargs": {
+            "text": text,
+            "uri": raw_uri,
+            "valid_window": valid_window,
+            "tx_window": tx_window,
+            "authority": source["authority"],
+            "metadata": metadata,
+            "doc_id": doc_id,
+            "external_id": external_id,
+            "version_id": _extract_version_id(payload),
+            "facets": facets,
+            "entities": entities,
+            "tags": payload.get("tags"),
+            "units": units,
+            "time_granularity": time_granularity,
+            "time_sigma_days": time_sigma,
+        },
+    }
+
+
+def _prepare_unstructured(text: str, uri: str) -> Dict:
     """Fallback for arbitrary text where we only have a rough valid-from signal."""
     valid_from = parse_date(text).date().isoformat()
-    valid_window = make_window(parse_date(valid_from), parse_date("9999-12-31"))
+    valid_window = make_window(parse_date(valid_from), _MAX_END)
     tx_window = make_window(parse_date(valid_from), parse_date(valid_from) + dt.timedelta(days=1))
     source = score_source(uri)
-    entities: List[str] = []
-    record = pvdb.ingest_document(
-        text=text,
-        uri=uri,
-        valid_window=valid_window,
-        tx_window=tx_window,
-        authority=source["authority"],
-        metadata={"uri": uri},
-        facets={},
-        entities=entities,
-        tags=None,
-        units=_detect_units(text, {}),
-        time_granularity=None,
-        time_sigma_days=None,
-    )
-    _apply_freshness_policy(policy, entities, uri)
-    return [record.chunk_id]
+    return {
+        "kind": "chunk",
+        "kwargs": {
+            "text": text,
+            "uri": uri,
+            "valid_window": valid_window,
+            "tx_window": tx_window,
+            "authority": source["authority"],
+            "metadata": {"uri": uri},
+            "facets": {},
+            "entities": [],
+            "tags": None,
+            "units": _detect_units(text, {}),
+            "time_granularity": None,
+            "time_sigma_days": None,
+        },
+    }
 
 
 def _is_world_economy(payload: Dict) -> bool:
@@ -251,10 +314,9 @@ def _is_world_economy(payload: Dict) -> bool:
 
 def _merge_facets(facets: Optional[Dict[str, str]], defaults: Dict[str, str]) -> Dict[str, str]:
     """Merge user-supplied facets with defaults without overwriting existing keys."""
-    merged = dict(facets or {})
-    for key, value in defaults.items():
-        merged.setdefault(key, value)
-    return merged
+    # Defaults first so user-supplied values win; one C-level merge replaces
+    # the per-key setdefault loop.
+    return {**defaults, **(facets or {})}
 
 
 def _resolve_valid_window(payload: Dict, facets: Dict[str, str]) -> Tuple[TimeWindow, Optional[str], Optional[int]]:
@@ -264,14 +326,14 @@ def _resolve_valid_window(payload: Dict, facets: Dict[str, str]) -> Tuple[TimeWi
     end_raw = valid.get("to")
     if start_raw is None and isinstance(payload.get("year"), int):
         start_raw = f"{payload['year']}-01-01"
-    start = parse_date(str(start_raw or "1970-01-01"))
+    start = parse_date(str(start_raw)) if start_raw else _EPOCH
     if end_raw:
         end = parse_date(str(end_raw))
     else:
         if valid.get("granularity") == "year" or facets.get("domain") == "world-economy":
-            end = dt.datetime(start.year + 1, 1, 1, tzinfo=dt.timezone.utc)
+            end = _year_end(start.year)
         else:
-            end = parse_date("9999-12-31")
+            end = _MAX_END
     window = make_window(start, end)
     granularity = valid.get("granularity")
     sigma = valid.get("sigma_days") or valid.get("sigma")
@@ -303,14 +365,19 @@ def _extract_version_id(payload: Dict) -> Optional[str]:
 
 def _derive_entities(payload: Dict, facets: Dict[str, str]) -> List[str]:
     """Infer entity tags (GDP, GDP_PC, Country:ISO3, Region) from text context."""
+    # Casefold each haystack as it is collected so the joined string is built
+    # exactly once, instead of allocating the full concatenation twice.
+    text = payload.get("text")
+    section = payload.get("section")
+    sections = payload.get("sections")
     haystacks: List[str] = []
-    if isinstance(payload.get("text"), str):
-        haystacks.append(payload["text"])
-    if isinstance(payload.get("section"), str):
-        haystacks.append(payload["section"])
-    if isinstance(payload.get("sections"), list):
-        haystacks.extend([str(item) for item in payload["sections"]])
-    combined = " ".join(haystacks).lower()
+    if isinstance(text, str):
+        haystacks.append(text.casefold())
+    if isinstance(section, str):
+        haystacks.append(section.casefold())
+    if isinstance(sections, list):
+        haystacks.extend(str(item).casefold() for item in sections)
+    combined = " ".join(haystacks)
     entities = set()
     if "gdp per capita" in combined or "per capita gdp" in combined:
         entities.add("GDP_PC")
@@ -318,12 +385,8 @@ def _derive_entities(payload: Dict, facets: Dict[str, str]) -> List[str]:
         entities.add("GDP")
     if "population" in combined:
         entities.add("Population")
-    for phrase, iso in COUNTRY_KEYWORDS.items():
-        if phrase in combined:
-            entities.add(f"Country:{iso}")
-    for phrase, region in REGION_KEYWORDS.items():
-        if phrase in combined:
-            entities.add(f"Region:{region}")
+    for match in _ENTITY_SCAN.finditer(combined):
+        entities.add(_ENTITY_KEYWORDS[match.group(1)])
     if facets.get("domain") == "world-economy":
         entities.add("Dataset:OECD_MADDISON")
     return sorted(entities)
@@ -331,10 +394,12 @@ def _derive_entities(payload: Dict, facets: Dict[str, str]) -> List[str]:
 
 def _detect_units(text: str, facets: Dict[str, str]) -> List[str]:
     """Return a list of detected unit tokens (e.g., intl_1990_usd, percent, ratio)."""
-    units: List[str] = []
-    for label, patterns in UNIT_PATTERNS.items():
-        if any(pattern.search(text) for pattern in patterns):
-            units.append(label)
+    found: set = set()
+    for match in _UNITS_RE.finditer(text):
+        found.add(match.lastgroup)
+        if len(found) == len(UNIT_PATTERNS):
+            break
+    units: List[str] = [label for label in UNIT_PATTERNS if label in found]
     lowered = text.lower()
     if facets.get("domain") == "world-economy":
         if "gdp" in lowered and "intl_1990_usd" not in units:
@@ -373,9 +438,7 @@ def _apply_freshness_policy(policy: Dict, entities: Iterable[str], uri: str) ->
     cache = get_cache()
     ttl = freshness_cfg.get("probe_interval_minutes", 60) * 60
     timestamp = time.time()
-    for entity in entities:
-        cache.set(
-            f"freshness:{entity}",
-            {"epoch": timestamp, "trigger": uri},
-            ex=ttl,
-        )
+    # One pipelined write per document instead of a round-trip per entity.
+    probes = {f"freshness:{entity}": {"epoch": timestamp, "trigger": uri} for entity in entities}
+    if probes:
+        cache.set_many(probes, ex=ttl)
@@ -19,4 +19,10 @@ def purge_system() -> Dict[str, str]:
     # Reset policy state to avoid stale idempotency keys interfering with new runs.
     state.policy_applied_keys.clear()
 
+    # Memoized answers cite the purged corpus and must go with it, exactly
+    # as the ingest and policy-apply paths invalidate them.
+    from app.services.answer_service import clear_answer_cache  # noqa: WPS433
+
+    clear_answer_cache()
+
     return {"status": "ok", "pvdb": "cleared", "cache": "cleared"}
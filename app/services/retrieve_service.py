@@ -14,16 +14,49 @@ same behaviour.
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from app.deps import get_models_cfg, get_policy_cfg, get_pvdb, get_reranker
-from app.utils.fusion import monotone_temporal_fusion
+from app.utils.fusion import monotone_temporal_fusion_batch
 from app.utils.time_windows import TimeWindow, tx_mismatch_penalty
 from core.gsm.intent import detect_intent
-from core.retrieval.lexical_bm25 import bm25_search
 from core.retrieval.reranker_llm import LLMJudgeReranker
 
+# Snapshot of (generation, chunk_map) reused across queries until the PVDB
+# generation counter moves, so steady-state retrieval avoids an O(N) corpus
+# walk per request.
+_DOCS_SNAPSHOT: Optional[Tuple[int, Dict]] = None
+
+
+# Last (models cfg, judge) pair: holding the cfg dict itself keeps its id from
+# being recycled, so a reload can never alias the old entry; a fresh dict
+# simply rotates in a fresh judge.
+_JUDGE_SNAPSHOT: Optional[Tuple[Dict, LLMJudgeReranker]] = None
+
+
+def _get_judge(models_cfg: Dict) -> LLMJudgeReranker:
+    """Return a judge reranker cached per models-config identity."""
+    global _JUDGE_SNAPSHOT
+    snapshot = _JUDGE_SNAPSHOT
+    if snapshot is not None and snapshot[0] is models_cfg:
+        return snapshot[1]
+    judge = LLMJudgeReranker(models_cfg)
+    _JUDGE_SNAPSHOT = (models_cfg, judge)
+    return judge
+
+
+def _get_chunk_map(pvdb) -> Dict:
+    """Return a cached chunk_id → chunk mapping for the current PVDB generation."""
+    global _DOCS_SNAPSHOT
+    snapshot = _DOCS_SNAPSHOT
+    if snapshot is None or snapshot[0] != pvdb.generation:
+        snapshot = (pvdb.generation, dict(pvdb.chunks))
+        _DOCS_SNAPSHOT = snapshot
+    return snapshot[1]
+
 
 def retrieve(
     query: str,
@@ -36,7 +69,7 @@ def retrieve(
     """Return top-k chunks ranked by hybrid scores for the supplied query."""
     pvdb = get_pvdb()
     reranker = get_reranker()
-    judge = LLMJudgeReranker(get_models_cfg())
+    judge = _get_judge(get_models_cfg())
     policy_cfg = get_policy_cfg()
 
     # Detect the domain (roles, finance, world-economy, etc.) so we can pull the
@@ -53,24 +86,25 @@ def retrieve(
 
     lexical_k, vector_k, rerank_limit = _hybrid_ks(inferred_domain, top_k)
 
-    chunks = pvdb.list_chunks()
-    docs = [(chunk.chunk_id, chunk.text) for chunk in chunks]
-    lexical = bm25_search(query, docs, top_k=lexical_k)
+    chunk_map = _get_chunk_map(pvdb)
+    lexical = pvdb.lexical_search(query, top_k=lexical_k)
     vector = pvdb.ann_search(query, top_k=vector_k)
 
-    # Merge lexical and vector candidates while retaining the highest scores seen
-    # for each chunk.  We keep both scores so the downstream fusion can reward
-    # chunks that shine in either space.
-    candidates: Dict[str, Dict] = {}
-    for chunk_id, score in lexical:
-        chunk = pvdb.chunks.get(chunk_id)
-        if not chunk:
-            continue
-        entry = candidates.setdefault(chunk_id, {"chunk": chunk, "lexical": 0.0, "vector": 0.0})
-        entry["lexical"] = max(entry["lexical"], score)
-    for chunk, score in vector:
-        entry = candidates.setdefault(chunk.chunk_id, {"chunk": chunk, "lexical": 0.0, "vector": 0.0})
-        entry["vector"] = max(entry["vector"], score)
+    # Merge lexical and vector candidates over the union of their ids in one
+    # comprehension.  Each source yields unique chunk ids, so plain dict views
+    # replace the old per-entry setdefault/max bookkeeping; we keep both scores
+    # so the downstream fusion can reward chunks that shine in either space.
+    lex_map = {chunk_id: score for chunk_id, score in lexical if chunk_id in chunk_map}
+    vec_chunks = {chunk.chunk_id: chunk for chunk, _ in vector}
+    vec_map = {chunk.chunk_id: score for chunk, score in vector}
+    candidates: Dict[str, Dict] = {
+        chunk_id: {
+            "chunk": chunk_map.get(chunk_id) or vec_chunks[chunk_id],
+            "lexical": lex_map.get(chunk_id, 0.0),
+            "vector": vec_map.get(chunk_id, 0.0),
+        }
+        for chunk_id in lex_map.keys() | vec_map.keys()
+    }
 
     temporal = pvdb.temporal_filter([entry["chunk"] for entry in candidates.values()], window, mode=mode)
     time_weights = {chunk.chunk_id: weight for chunk, weight in temporal}
@@ -113,49 +147,63 @@ def retrieve(
         )
     }
 
-    results: List[Dict] = []
-    for chunk_id, data in ranked_candidates:
+    # Pass 1: gather candidate signals into SoA arrays and fuse them in a
+    # single vectorized expression instead of a Python call per candidate.
+    count = len(ranked_candidates)
+    rank_arr = np.empty(count, dtype=np.float64)
+    time_arr = np.empty(count, dtype=np.float64)
+    auth_arr = np.empty(count, dtype=np.float64)
+    mismatch_arr = np.empty(count, dtype=np.float64)
+    cand_start = np.empty(count, dtype=np.float64)
+    cand_end = np.empty(count, dtype=np.float64)
+    for idx, (chunk_id, data) in enumerate(ranked_candidates):
         chunk = data["chunk"]
         rank_score = rerank_scores.get(chunk_id, float(data["lexical"] + data["vector"]))
         if chunk_id in judge_scores:
             rank_score = (rank_score + judge_scores[chunk_id]) / 2.0
-        bias = _units_bias(chunk.units)
-        rank_score = min(1.0, rank_score + bias)
-        time_weight = time_weights[chunk_id]
-        authority = chunk.authority
-        mismatch = tx_mismatch_penalty(chunk.valid_window, chunk.tx_window)
-        age_penalty = _age_penalty(window, chunk.valid_window)
-        final = monotone_temporal_fusion(
-            rank_score,
-            time_weight,
-            authority,
-            mismatch,
-            age_penalty,
-            weights_cfg,
-        )
-        region = _extract_region(chunk.entities, chunk.facets)
-        results.append(
-            {
-                "chunk_id": chunk_id,
-                "doc_id": chunk.doc_id,
-                "text": chunk.text,
-                "uri": chunk.uri,
-                "valid_window": {
-                    "from": chunk.valid_window.start.isoformat(),
-                    "to": chunk.valid_window.end.isoformat(),
-                },
-                "authority": authority,
-                "rerank": float(rank_score),
-                "final_score": final,
-                "time_weight": time_weight,
-                "facets": chunk.facets,
-                "entities": chunk.entities,
-                "units_detected": chunk.units,
-                "time_granularity": chunk.time_granularity,
-                "time_sigma_days": chunk.time_sigma_days,
-                "region": region,
-            }
-        )
+        rank_arr[idx] = min(1.0, rank_score + _units_bias(chunk.units))
+        time_arr[idx] = time_weights[chunk_id]
+        auth_arr[idx] = chunk.authority
+        mismatch_arr[idx] = tx_mismatch_penalty(chunk.valid_window, chunk.tx_window)
+        cand_start[idx] = chunk.valid_start_ts
+        cand_end[idx] = chunk.valid_end_ts
+    age_arr = _age_penalty_batch(window, cand_start, cand_end)
+    final_scores = monotone_temporal_fusion_batch(
+        rank_arr,
+        time_arr,
+        auth_arr,
+        mismatch_arr,
+        age_arr,
+        weights_cfg,
+    )
+
+    # Pass 2: a single comprehension assembles the per-candidate payload dicts
+    # from the fused score arrays; no scoring math happens here.
+    rank_list = rank_arr.tolist()
+    score_list = final_scores.tolist()
+    results: List[Dict] = [
+        {
+            "chunk_id": chunk_id,
+            "doc_id": chunk.doc_id,
+            "text": chunk.text,
+            "uri": chunk.uri,
+            # Kept as a TimeWindow internally; serialized to the {from, to}
+            # dict form only at the API boundary (see routes/retrieve.py).
+            "valid_window": chunk.valid_window,
+            "authority": chunk.authority,
+            "rerank": rank_list[idx],
+            "final_score": score_list[idx],
+            "time_weight": time_weights[chunk_id],
+            "facets": chunk.facets,
+            "entities": chunk.entities,
+            "units_detected": chunk.units,
+            "time_granularity": chunk.time_granularity,
+            "time_sigma_days": chunk.time_sigma_days,
+            "region": _extract_region(chunk.entities, chunk.facets),
+        }
+        for idx, (chunk_id, data) in enumerate(ranked_candidates)
+        for chunk in (data["chunk"],)
+    ]
 
     _apply_region_diversity(results)
     results.sort(key=lambda item: item["final_score"], reverse=True)
@@ -187,16 +235,22 @@ def _hybrid_ks(domain: str, requested: int) -> Tuple[int, int, int]:
     return base, base, min(base, 30)
 
 
-def _age_penalty(query_window: TimeWindow, candidate_window: TimeWindow) -> float:
-    """Return a penalty proportional to the temporal gap between candidate and query."""
-    if candidate_window.intersects(query_window):
-        return 0.0
-    gap = min(
-        abs((candidate_window.start - query_window.end).total_seconds()),
-        abs((query_window.start - candidate_window.end).total_seconds()),
-    )
+def _age_penalty_batch(
+    query_window: TimeWindow,
+    cand_start: np.ndarray,
+    cand_end: np.ndarray,
+) -> np.ndarray:
+    """Return per-candidate penalties proportional to the temporal gap to the query.
+
+    Operates on epoch-second arrays for all candidates at once; overlapping
+    windows get zero penalty, everything else scales with gap up to ten years.
+    """
+    q_start = query_window.start_ts
+    q_end = query_window.end_ts
+    overlap = (cand_end > q_start) & (cand_start < q_end)
+    gap = np.minimum(np.abs(cand_start - q_end), np.abs(q_start - cand_end))
     days = gap / 86400.0
-    return min(1.0, days / 3650.0)
+    return np.where(overlap, 0.0, np.clip(days / 3650.0, 0.0, 1.0))
 
 
 def _units_bias(units: List[str]) -> float:
@@ -219,14 +273,28 @@ def _extract_region(entities: List[str], facets: Dict[str, str]) -> Optional[str
     return facets.get("region")
 
 
+# Progressive diversity factors indexed by occurrence number: the first hit of
+# a region keeps its score, each repeat loses a further 8%, floored at zero.
+# Precomputing the table leaves one lookup and one multiply in the hot loop.
+_DIVERSITY_FACTORS = tuple(max(0.0, 1.0 - 0.08 * k) for k in range(14))
+
+
 def _apply_region_diversity(results: List[Dict]) -> None:
     """Softly penalise over-represented regions to diversify the final hit list."""
-    seen_counts: Dict[str, int] = defaultdict(int)
+    # One C-level Counter pass finds the repeated regions; the penalty loop
+    # then only tracks occurrence order for those, leaving the common
+    # all-distinct case untouched.
+    counts = Counter(item["region"] for item in results if item.get("region"))
+    if not counts or counts.most_common(1)[0][1] < 2:
+        return
+    seen: Dict[str, int] = {}
+    last_factor = len(_DIVERSITY_FACTORS) - 1
     for item in results:
         region = item.get("region")
-        if not region:
+        if not region or counts[region] < 2:
             continue
-        seen_counts[region] += 1
-        if seen_counts[region] > 1:
-            penalty = 0.08 * (seen_counts[region] - 1)
-            item["final_score"] = max(0.0, item["final_score"] * (1.0 - penalty))
+        occurrence = seen.get(region, 0) + 1
+        seen[region] = occurrence
+        if occurrence > 1:
+            factor = _DIVERSITY_FACTORS[min(occurrence - 1, last_factor)]
+            item["final_score"] = item["final_score"] * factor
@@ -7,13 +7,16 @@ used in audit trails.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Dict, Iterable, List, Optional, Tuple
 
-from app.utils.time_windows import TimeWindow, window_iou
+import numpy as np
 
+from app.utils.time_windows import TimeWindow
 
-@dataclass
+
+@dataclass(slots=True)
 class ChronoPassage:
     """Wrapper holding passage text plus metadata needed for chronological checks."""
 
@@ -28,21 +31,29 @@ class ChronoPassage:
     entities: List[str]
     units: List[str]
     region: Optional[str] = None
+    # Dedup and sort keys computed once at construction so reduce_passages
+    # never re-normalises multi-KB snippet text or chases attributes per
+    # comparison.
+    _key: Tuple[str, float] = field(init=False, repr=False)
+    _sort_key: Tuple[float, float, float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._key = (self.text.strip().lower(), self.valid_window.start_ts)
+        self._sort_key = (self.valid_window.start_ts, -self.authority, -self.score)
 
 
 def reduce_passages(passages: Iterable[ChronoPassage]) -> List[ChronoPassage]:
     """Merge passages chronologically, preferring higher-authority/high-score entries."""
-    bucket = {}
+    bucket: Dict[Tuple[str, float], ChronoPassage] = {}
     for passage in passages:
-        key = (passage.text.strip().lower(), passage.valid_window.start)
-        current = bucket.get(key)
+        current = bucket.get(passage._key)
         if current is None or passage.authority > current.authority or passage.score > current.score:
-            bucket[key] = passage
-    ordered = sorted(bucket.values(), key=lambda p: (p.valid_window.start, -p.authority, -p.score))
-    return ordered
+            bucket[passage._key] = passage
+    # attrgetter fetches the precomputed key without a lambda frame per item.
+    return sorted(bucket.values(), key=attrgetter("_sort_key"))
 
 
-@dataclass
+@dataclass(slots=True)
 class ChronoConflict:
     """Represents two passages whose windows overlap beyond a threshold."""
 
@@ -51,21 +62,110 @@ class ChronoConflict:
     overlap: float
 
 
+@dataclass(slots=True)
+class PassageTable:
+    """Structure-of-arrays view over a passage list.
+
+    The numeric columns let the conflict/decay math run on contiguous float64
+    arrays instead of chasing ``passage.valid_window.start_ts`` pointers per
+    element; ``passages`` keeps the original objects for output construction.
+    """
+
+    passages: List[ChronoPassage]
+    starts: np.ndarray
+    ends: np.ndarray
+    authority: np.ndarray
+    score: np.ndarray
+
+    @classmethod
+    def from_passages(cls, passages: List[ChronoPassage]) -> "PassageTable":
+        """Extract all numeric columns in one walk over the passage list."""
+        count = len(passages)
+        return cls(
+            passages=passages,
+            starts=np.fromiter((p.valid_window.start_ts for p in passages), dtype=np.float64, count=count),
+            ends=np.fromiter((p.valid_window.end_ts for p in passages), dtype=np.float64, count=count),
+            authority=np.fromiter((p.authority for p in passages), dtype=np.float64, count=count),
+            score=np.fromiter((p.score for p in passages), dtype=np.float64, count=count),
+        )
+
+
+def analyze_passages(
+    passages: Iterable[ChronoPassage], threshold: float = 0.6
+) -> Tuple[List[ChronoPassage], List[ChronoConflict]]:
+    """Deduplicate passages and detect conflicts among the survivors in one pass.
+
+    Fuses :func:`reduce_passages` and :func:`detect_conflicts` so the column
+    arrays are extracted once from the freshly sorted list instead of walking
+    the passages again.
+    """
+    reduced = reduce_passages(passages)
+    if len(reduced) < 2:
+        return reduced, []
+    return reduced, _conflicts_from_table(PassageTable.from_passages(reduced), threshold)
+
+
 def detect_conflicts(passages: List[ChronoPassage], threshold: float = 0.6) -> List[ChronoConflict]:
-    """Return overlapping passage pairs whose IoU meets or exceeds the threshold."""
-    conflicts: List[ChronoConflict] = []
-    for idx, first in enumerate(passages):
-        for second in passages[idx + 1 :]:
-            overlap = window_iou(first.valid_window, second.valid_window)
-            if overlap >= threshold:
-                conflicts.append(ChronoConflict(first=first, second=second, overlap=overlap))
-    return conflicts
+    """Return overlapping passage pairs whose IoU meets or exceeds the threshold.
+
+    The pairwise IoU matrix is computed with NumPy broadcasting over epoch
+    seconds, so the Python-level cost scales with the number of conflicting
+    pairs rather than all N² pairs.
+    """
+    if len(passages) < 2:
+        return []
+    return _conflicts_from_table(PassageTable.from_passages(passages), threshold)
+
+
+def _conflicts_from_table(table: PassageTable, threshold: float) -> List[ChronoConflict]:
+    """Vectorized conflict core operating on the SoA window columns."""
+    passages = table.passages
+    starts = table.starts
+    ends = table.ends
+    count = len(passages)
+    durations = np.maximum(0.0, ends - starts)
+
+    # Plane-sweep prefilter: with passages viewed in start order, a window can
+    # only overlap the ones whose start falls before its end, so candidate
+    # pairs are contiguous runs instead of the full upper triangle.  Disjoint
+    # pairs have IoU 0 and can only matter for a non-positive threshold, in
+    # which case every pair conflicts anyway.
+    if threshold <= 0:
+        rows, cols = np.triu_indices(count, k=1)
+    else:
+        order = np.argsort(starts, kind="stable")
+        sorted_starts = starts[order]
+        next_idx = np.arange(1, count + 1)
+        his = np.maximum(np.searchsorted(sorted_starts, ends[order], side="left"), next_idx)
+        lengths = his - next_idx
+        total = int(lengths.sum())
+        if not total:
+            return []
+        rows_sorted = np.repeat(np.arange(count), lengths)
+        # Expand each [next_idx, hi) run without a Python-level loop: a global
+        # arange offset by each run's start yields all candidate columns.
+        run_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        cols_sorted = np.arange(total) + np.repeat(next_idx - run_starts, lengths)
+        left = order[rows_sorted]
+        right = order[cols_sorted]
+        rows = np.minimum(left, right)
+        cols = np.maximum(left, right)
+        keep = np.lexsort((cols, rows))
+        rows, cols = rows[keep], cols[keep]
+
+    inter = np.maximum(0.0, np.minimum(ends[rows], ends[cols]) - np.maximum(starts[rows], starts[cols]))
+    union = durations[rows] + durations[cols] - inter
+    with np.errstate(divide="ignore", invalid="ignore"):
+        iou = np.where(union > 0, inter / union, 0.0)
+    mask = iou >= threshold
+    return [
+        ChronoConflict(first=passages[i], second=passages[j], overlap=float(overlap))
+        for i, j, overlap in zip(rows[mask], cols[mask], iou[mask])
+    ]
 
 
 def build_dual_timelines(passages: List[ChronoPassage]) -> List[Tuple[str, str]]:
     """Produce short (timestamp, text) tuples used to explain conflicting evidence."""
-    timelines: List[Tuple[str, str]] = []
-    for passage in passages:
-        label = passage.valid_window.start.date().isoformat()
-        timelines.append((label, passage.text[:140]))
-    return timelines
+    # The ISO date label is cached on the (immutable) TimeWindow, so this is a
+    # single C-level comprehension with no per-passage date() allocation.
+    return [(p.valid_window.start_date_iso, p.text[:140]) for p in passages]
@@ -2,7 +2,33 @@
 
 from __future__ import annotations
 
-from typing import Dict
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+# Last (weights dict, unpacked tuple) pair.  Fusion weights come from the
+# loaded policy config and are stable between reloads, so the five .get/clamp
+# calls collapse to an identity check on repeat invocations.  The snapshot
+# keeps a strong reference to the dict so a reloaded config can never reuse
+# the old dict's address and hit a stale entry.
+_WEIGHTS_SNAPSHOT: Optional[Tuple[Dict[str, float], Tuple[float, float, float, float, float]]] = None
+
+
+def _unpack_weights(weights: Dict[str, float]) -> Tuple[float, float, float, float, float]:
+    """Clamp and unpack the fusion weights, memoized on the dict's identity."""
+    global _WEIGHTS_SNAPSHOT
+    snapshot = _WEIGHTS_SNAPSHOT
+    if snapshot is not None and snapshot[0] is weights:
+        return snapshot[1]
+    unpacked = (
+        max(0.0, min(1.0, weights.get("alpha", 0.55))),
+        max(0.0, min(1.0, weights.get("beta_time", 0.25))),
+        max(0.0, min(1.0, weights.get("gamma_authority", 0.15))),
+        max(0.0, weights.get("delta_age", 0.05)),
+        max(0.0, weights.get("tx_gamma", 0.40)),
+    )
+    _WEIGHTS_SNAPSHOT = (weights, unpacked)
+    return unpacked
 
 
 def monotone_temporal_fusion(
@@ -14,13 +40,34 @@ def monotone_temporal_fusion(
     weights: Dict[str, float],
 ) -> float:
     """Blend retrieval signals into a single monotonic score in [0, 1]."""
-    alpha = max(0.0, min(1.0, weights.get("alpha", 0.55)))
-    beta_time = max(0.0, min(1.0, weights.get("beta_time", 0.25)))
-    gamma_auth = max(0.0, min(1.0, weights.get("gamma_authority", 0.15)))
-    delta_age = max(0.0, weights.get("delta_age", 0.05))
-    tx_gamma = max(0.0, weights.get("tx_gamma", 0.40))
+    alpha, beta_time, gamma_auth, delta_age, tx_gamma = _unpack_weights(weights)
 
     base = (alpha * max(0.0, min(1.0, r))) + (beta_time * max(0.0, min(1.0, t))) + (gamma_auth * max(0.0, min(1.0, a)))
     penalty = (delta_age * max(0.0, min(1.0, age_penalty))) + (tx_gamma * max(0.0, min(1.0, tx_mismatch)))
     combined = max(0.0, base - penalty)
     return min(1.0, combined)
+
+
+def monotone_temporal_fusion_batch(
+    r: np.ndarray,
+    t: np.ndarray,
+    a: np.ndarray,
+    tx_mismatch: np.ndarray,
+    age_penalty: np.ndarray,
+    weights: Dict[str, float],
+) -> np.ndarray:
+    """Vectorized counterpart of :func:`monotone_temporal_fusion`.
+
+    Accepts aligned candidate arrays and returns the fused scores in one
+    NumPy expression instead of a Python call per candidate; the weights are
+    unpacked into scalars once so only array math runs per element.
+    """
+    alpha, beta_time, gamma_auth, delta_age, tx_gamma = _unpack_weights(weights)
+
+    base = (
+        alpha * np.clip(r, 0.0, 1.0)
+        + beta_time * np.clip(t, 0.0, 1.0)
+        + gamma_auth * np.clip(a, 0.0, 1.0)
+    )
+    penalty = delta_age * np.clip(age_penalty, 0.0, 1.0) + tx_gamma * np.clip(tx_mismatch, 0.0, 1.0)
+    return np.clip(base - penalty, 0.0, 1.0)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 from typing import Iterator
 
 try:  # Optional OpenTelemetry import
@@ -8,12 +8,17 @@ try:  # Optional OpenTelemetry import
 except Exception:  # pragma: no cover
     trace = None
 
+# Resolve the tracer once at import; get_tracer is cheap but not free and
+# traced_span sits on every request path.
+_TRACER = trace.get_tracer(__name__) if trace else None
 
-@contextmanager
-def traced_span(name: str) -> Iterator[None]:
-    if trace:
-        tracer = trace.get_tracer(__name__)
-        with tracer.start_as_current_span(name):
+if _TRACER is None:
+    def traced_span(name: str) -> "nullcontext[None]":
+        """No-op span when OpenTelemetry is not installed."""
+        return nullcontext()
+else:
+    @contextmanager
+    def traced_span(name: str) -> Iterator[None]:
+        """Open an OpenTelemetry span around the wrapped block."""
+        with _TRACER.start_as_current_span(name):
             yield
-    else:
-        yield
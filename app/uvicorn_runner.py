@@ -1,20 +1,45 @@
 from __future__ import annotations
 
+import os
 import sys
 from pathlib import Path
 
 import uvicorn
 
+try:  # Optional C-accelerated event loop / HTTP parser
+    import uvloop  # noqa: F401
+    _LOOP = "uvloop"
+except Exception:  # pragma: no cover
+    _LOOP = "auto"
+
+try:
+    import httptools  # noqa: F401
+    _HTTP = "httptools"
+except Exception:  # pragma: no cover
+    _HTTP = "auto"
+
 
 def main():
     root = Path(__file__).resolve().parent.parent
     if str(root) not in sys.path:
         sys.path.insert(0, str(root))
+    reload_enabled = os.getenv("CHRONORAG_RELOAD", "") == "1"
+    # Default to a single worker: each worker builds its own in-memory PVDB
+    # over the same snapshot/WAL files, so multiple processes diverge on
+    # ingest and race each other's flushes. WEB_CONCURRENCY stays available
+    # as an explicit opt-in for read-only deployments that accept that.
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
     uvicorn.run(
         "app.main:app",
         host="127.0.0.1",
         port=8000,
-        reload=False,
+        reload=reload_enabled,
+        loop=_LOOP,
+        http=_HTTP,
+        # uvicorn ignores workers under reload; skip it explicitly to avoid
+        # the startup warning.
+        workers=None if reload_enabled else workers,
+        log_level="warning",
     )
 
 
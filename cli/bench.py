@@ -1,18 +1,52 @@
+"""Warmup-and-repeat latency benchmark for the retrieval path."""
+
 from __future__ import annotations
 
-import time
+import argparse
+import gc
+from time import perf_counter_ns
 
 from app.deps import get_app_state
 from app.services.retrieve_service import retrieve
 
+_QUERY = "Who is the CEO today?"
+_WARMUP_ITERS = 5
+
+
+def _percentile(samples_ns: list, fraction: float) -> float:
+    """Return the given percentile of a sorted nanosecond sample, in ms."""
+    index = min(len(samples_ns) - 1, int(len(samples_ns) * fraction))
+    return samples_ns[index] / 1e6
+
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the retrieve() hot path")
+    parser.add_argument("--iters", type=int, default=30, help="timed iterations (after warmup)")
+    args = parser.parse_args()
+
     state = get_app_state()
-    decision = state.router.route("Who is the CEO today?", None, signals=None)
-    start = time.time()
-    retrieve("Who is the CEO today?", decision.window, decision.mode, top_k=3)
-    duration = (time.time() - start) * 1000
-    print(f"Retrieve p50 ~= {duration:.2f} ms")
+    decision = state.router.route(_QUERY, None, signals=None)
+
+    # Warmup absorbs cold-cache effects (lazy index builds, lru_cache fills)
+    # so the timed loop measures the steady-state path.
+    for _ in range(_WARMUP_ITERS):
+        retrieve(_QUERY, decision.window, decision.mode, top_k=3)
+
+    samples_ns = []
+    gc.disable()
+    try:
+        for _ in range(max(1, args.iters)):
+            start = perf_counter_ns()
+            retrieve(_QUERY, decision.window, decision.mode, top_k=3)
+            samples_ns.append(perf_counter_ns() - start)
+    finally:
+        gc.enable()
+
+    samples_ns.sort()
+    print(f"Retrieve latency over {len(samples_ns)} iters ({_WARMUP_ITERS} warmup):")
+    print(f"  p50 = {_percentile(samples_ns, 0.50):.3f} ms")
+    print(f"  p95 = {_percentile(samples_ns, 0.95):.3f} ms")
+    print(f"  p99 = {_percentile(samples_ns, 0.99):.3f} ms")
 
 
 if __name__ == "__main__":
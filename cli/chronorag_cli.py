@@ -10,6 +10,7 @@ from app.services.answer_service import answer
 from app.services.ingest_service import ingest
 from app.services.retrieve_service import retrieve
 from app.services.maintenance_service import purge_system
+from app.utils.cards import window_to_payload
 
 
 def cmd_ingest(args: argparse.Namespace) -> None:
@@ -28,6 +29,8 @@ def cmd_retrieve(args: argparse.Namespace) -> None:
     state = get_app_state()
     decision = state.router.route(args.query, None, signals=None)
     data = retrieve(args.query, decision.window, args.mode, top_k=args.top_k, axis=args.axis)
+    for item in data["results"]:
+        item["valid_window"] = window_to_payload(item["valid_window"])
     print(json.dumps(data, indent=2, default=str))
 
 
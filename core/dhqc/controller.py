@@ -8,7 +8,7 @@ from typing import Dict
 from core.dhqc.signals import RetrievalSignals
 
 
-@dataclass
+@dataclass(slots=True)
 class DHQCPlan:
     """Simple data container describing hop count and candidate budget."""
 
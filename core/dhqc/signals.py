@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievalSignals:
     """Lightweight metrics describing retrieval health."""
 
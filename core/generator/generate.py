@@ -8,28 +8,48 @@ the LLM is unreachable we fall back to an evidence digest.
 
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import ValidationError
+
 from app.utils.chrono_reducer import ChronoPassage
 from app.utils.time_windows import TimeWindow
 from core.generator.llm_loader import load_backend
 from core.generator.prompts import build_messages
+from core.generator.semantic_cache import SemanticAnswerCache
 
 # Separator injected into the prompt; we cut any text that follows this marker.
 STOP_MARKER = "<|ATTR_CARD|>"
 logger = logging.getLogger(__name__)
 
+# Two-tier answer cache: exact (query, context) hits plus an embedding
+# similarity fallback for paraphrases over the same evidence.  Only
+# successful structured generations are cached — never the fallback digest,
+# so a recovered backend is not masked by stale failures.
+_ANSWER_CACHE = SemanticAnswerCache()
+
+
+def clear_generation_cache() -> None:
+    """Drop cached generations after policy updates or fresh ingests."""
+    _ANSWER_CACHE.clear()
+
 
 def _format_passage_line(idx: int, passage: ChronoPassage) -> str:
     text = passage.text.strip().replace("\n", " ")
     if len(text) > 220:
-        text = text[:220].rsplit(" ", 1)[0] + "…"
-    window = f"{passage.valid_window.start.date()} → {passage.valid_window.end.date()}"
-    source = passage.uri
-    return f"{idx}. {text} (Window: {window}; Source: {source})"
+        # Plain slice; the old rsplit word-boundary scan isn't worth a pass
+        # over the tail of every long snippet for a fallback digest.
+        text = text[:219] + "…"
+    window = passage.valid_window
+    return (
+        f"{idx}. {text} (Window: {window.start_date_iso} → {window.end.date()}; "
+        f"Source: {passage.uri})"
+    )
 
 
 def _fallback_response(query: str, evidence: List[ChronoPassage]) -> str:
@@ -48,86 +68,103 @@ def _fallback_response(query: str, evidence: List[ChronoPassage]) -> str:
     return "\n".join(lines) + "\n\n" + STOP_MARKER
 
 
-def _inject_json_instructions(messages: List[dict]) -> None:
-    """Append strict JSON formatting instructions to the final user message."""
-    json_instruction = (
-        "Respond ONLY with minified JSON matching this schema:\n"
-        '{"range":{"low":number,"high":number,"most_likely":number,"unit":"1990_intl_usd"},'
-        '"bullets":[{"summary":string,"source":string},{"summary":string,"source":string}]}\n'
-        "- Use floats for numeric fields and ensure low <= most_likely <= high.\n"
-        "- Summaries must mention the referenced year (YYYY) and stay within 20 words.\n"
-        "- Sources must be concise citations or URIs.\n"
-        "- Do not emit any text outside the JSON object."
-    )
-    messages[-1]["content"] = f"{messages[-1]['content']}\n\n{json_instruction}"
+# Hoisted: the year regex used to be recompiled inside the validation loop.
+_YEAR_RE = re.compile(r"\b(18\d{2}|190\d|191[0-3])\b")
+
+
+class _ValueRange(BaseModel):
+    """Numeric estimate block of a structured answer."""
+
+    model_config = ConfigDict(strict=True)
+
+    low: float
+    high: float
+    most_likely: float
+    unit: str
+
+    @model_validator(mode="after")
+    def _check_range(self) -> "_ValueRange":
+        if not (self.low <= self.most_likely <= self.high):
+            raise ValueError("most_likely must fall within [low, high]")
+        if self.low < 10 or self.high > 20000:
+            raise ValueError("values must stay within the 10-20000 band for 1990 intl$")
+        if "1990" not in self.unit or "intl" not in self.unit.lower():
+            raise ValueError("unit must specify 1990 international dollars")
+        return self
+
+
+class _Bullet(BaseModel):
+    """One evidence bullet with a year-anchored summary and citation."""
+
+    model_config = ConfigDict(strict=True)
+
+    summary: str
+    source: str
+
+    @field_validator("summary")
+    @classmethod
+    def _check_summary(cls, value: str) -> str:
+        stripped = value.strip()
+        if not stripped:
+            raise ValueError("summary missing")
+        # Space count is an upper bound on words-1, so well-formed summaries
+        # skip the split()'s throwaway list; the exact count only runs when
+        # the cheap scan suggests an overflow (e.g. runs of spaces).
+        if stripped.count(" ") >= 20 and len(stripped.split()) > 20:
+            raise ValueError("summary exceeds 20 words")
+        # Bounded scan: a compliant summary fits well inside 300 chars, and
+        # this caps regex work on pathological unbroken strings.
+        if not _YEAR_RE.search(stripped, 0, 300):
+            raise ValueError("summary lacks year reference")
+        return value
+
+    @field_validator("source")
+    @classmethod
+    def _check_source(cls, value: str) -> str:
+        if not value.strip():
+            raise ValueError("source missing")
+        return value
+
+
+class _AnswerPayload(BaseModel):
+    """Schema of the full structured answer object."""
+
+    model_config = ConfigDict(strict=True)
+
+    range: _ValueRange
+    bullets: List[_Bullet] = Field(min_length=2, max_length=2)
+
+
+# Pre-bound entry into pydantic-core: one LOAD_GLOBAL per validation instead
+# of a class attribute chain.
+_VALIDATE = _AnswerPayload.model_validate
 
 
 def _validate_payload(payload: Dict[str, Any]) -> List[str]:
-    """Validate structured JSON payload and return issues (empty when valid)."""
-    issues: List[str] = []
-    value_range = payload.get("range")
-    bullets = payload.get("bullets")
+    """Validate structured JSON payload and return issues (empty when valid).
 
-    if not isinstance(value_range, dict):
-        issues.append("range field missing or not an object")
-    else:
-        for key in ("low", "high", "most_likely"):
-            val = value_range.get(key)
-            if not isinstance(val, (int, float)):
-                issues.append(f"{key} must be numeric")
-        numeric_present = all(
-            isinstance(value_range.get(key), (int, float)) for key in ("low", "high", "most_likely")
-        )
-        if numeric_present:
-            low = float(value_range["low"])
-            high = float(value_range["high"])
-            most = float(value_range["most_likely"])
-            if not (low <= most <= high):
-                issues.append("most_likely must fall within [low, high]")
-            if low < 10 or high > 20000:
-                issues.append("values must stay within the 10-20000 band for 1990 intl$")
-        unit = value_range.get("unit")
-        if not isinstance(unit, str) or "1990" not in unit or "intl" not in unit.lower():
-            issues.append("unit must specify 1990 international dollars")
-
-    if not isinstance(bullets, list) or len(bullets) != 2:
-        issues.append("exactly two bullets required")
-    else:
-        year_pattern = re.compile(r"\b(18\d{2}|190\d|191[0-3])\b")
-        for idx, bullet in enumerate(bullets):
-            if not isinstance(bullet, dict):
-                issues.append(f"bullet {idx} must be an object")
-                continue
-            summary = bullet.get("summary")
-            source = bullet.get("source")
-            if not isinstance(summary, str) or not summary.strip():
-                issues.append(f"bullet {idx} summary missing")
-            else:
-                words = summary.strip().split()
-                if len(words) > 20:
-                    issues.append(f"bullet {idx} summary exceeds 20 words")
-                if not year_pattern.search(summary):
-                    issues.append(f"bullet {idx} summary lacks year reference")
-            if not isinstance(source, str) or not source.strip():
-                issues.append(f"bullet {idx} source missing")
-    return issues
+    Delegates the structural checks to a pydantic model (validated in the
+    compiled pydantic-core, not interpretive isinstance walks); the custom
+    range/unit/year constraints live in the model's validators.
+    """
+    try:
+        _VALIDATE(payload)
+    except ValidationError as exc:
+        return [
+            "{}: {}".format(".".join(str(part) for part in err["loc"]) or "payload", err["msg"])
+            for err in exc.errors()
+        ]
+    return []
 
 
-def _run_structured_generation(
-    backend,
-    messages: List[dict],
-    max_tokens: int,
-    temperature: float,
-    stop_list: List[str],
-) -> Tuple[Optional[Dict[str, Any]], str, List[str]]:
-    """Execute a generation attempt and return (payload, text, validation_issues)."""
-    raw = backend.generate(messages, max_tokens=max_tokens, temperature=temperature, stop=stop_list)
+def _check_structured_response(raw: str) -> Tuple[Optional[Dict[str, Any]], str, List[str]]:
+    """Decode and validate a raw completion; shared by the sync/async paths."""
     text = raw.split(STOP_MARKER)[0].strip()
     if not text:
         return None, text, ["empty response"]
     try:
-        payload = json.loads(text)
-    except json.JSONDecodeError as exc:
+        payload = orjson.loads(text)
+    except orjson.JSONDecodeError as exc:
         logger.warning("Failed to decode JSON response: %s", exc)
         return None, text, ["invalid JSON"]
     issues = _validate_payload(payload)
@@ -136,6 +173,117 @@ def _run_structured_generation(
     return payload, text, []
 
 
+def _run_structured_generation(
+    backend,
+    messages: List[dict],
+    max_tokens: int,
+    temperature: float,
+    stop_list: List[str],
+) -> Tuple[Optional[Dict[str, Any]], str, List[str]]:
+    """Execute a generation attempt and return (payload, text, validation_issues)."""
+    raw = backend.generate(messages, max_tokens=max_tokens, temperature=temperature, stop=stop_list)
+    return _check_structured_response(raw)
+
+
+async def _arun_structured_generation(
+    backend,
+    messages: List[dict],
+    max_tokens: int,
+    temperature: float,
+    stop_list: List[str],
+) -> Tuple[Optional[Dict[str, Any]], str, List[str]]:
+    """Async generation attempt; falls back to a worker thread for sync-only backends."""
+    agenerate = getattr(backend, "agenerate", None)
+    if agenerate is not None:
+        raw = await agenerate(messages, max_tokens=max_tokens, temperature=temperature, stop=stop_list)
+    else:
+        raw = await asyncio.to_thread(
+            backend.generate, messages, max_tokens=max_tokens, temperature=temperature, stop=stop_list
+        )
+    return _check_structured_response(raw)
+
+
+# Each backend names its completion-budget knob differently in models.yaml.
+_BACKEND_LIMIT_KEYS = {
+    "local_hf": "max_new_tokens",
+    "openai_compat": "max_tokens",
+    "llama_cpp": "max_new_tokens",
+    "ollama": "max_tokens",
+}
+
+
+def _resolve_generation_params(llm_cfg: Dict, backend_name: str) -> Tuple[List[str], int, float]:
+    """Return (stop_list, max_tokens, temperature) for the selected backend."""
+    stop_list = [STOP_MARKER]
+    max_tokens = 512
+    temperature = 0.15
+    limit_key = _BACKEND_LIMIT_KEYS.get(backend_name)
+    if limit_key:
+        entry = llm_cfg.get(backend_name, {})
+        stop_list = entry.get("stop", stop_list)
+        max_tokens = entry.get(limit_key, max_tokens)
+        temperature = entry.get("temperature", temperature)
+    return stop_list, max_tokens, temperature
+
+
+def _build_attempt_specs(
+    evidence: List[ChronoPassage], llm_cfg: Dict
+) -> List[Tuple[str, List[ChronoPassage], int]]:
+    """Return the (tag, evidence, snippet_chars) plan for the attempt loop."""
+    prompt_limits = llm_cfg.get("prompt_limits", {})
+    max_passages = prompt_limits.get("max_passages")
+    snippet_chars = prompt_limits.get("snippet_chars", 180)
+    if not isinstance(snippet_chars, int) or snippet_chars <= 0:
+        snippet_chars = 180
+    prompt_evidence = evidence
+    if isinstance(max_passages, int) and max_passages > 0:
+        prompt_evidence = evidence[:max_passages]
+
+    attempt_specs = [("primary", prompt_evidence, snippet_chars)]
+    retry_evidence = prompt_evidence[: min(len(prompt_evidence), 8)]
+    retry_snippet = min(snippet_chars, 100)
+    if retry_evidence and retry_evidence != prompt_evidence:
+        attempt_specs.append(("retry", retry_evidence, retry_snippet))
+    return attempt_specs
+
+
+def _attempt_messages(
+    query: str,
+    mode: str,
+    axis: str,
+    window: TimeWindow,
+    attempt_evidence: List[ChronoPassage],
+    domain: str,
+    window_kind: str,
+    snippet_chars: int,
+) -> List[dict]:
+    """Build one attempt's chat messages (JSON instructions live in the system prompt)."""
+    return build_messages(
+        query,
+        mode,
+        axis,
+        window,
+        attempt_evidence,
+        domain,
+        window_kind,
+        snippet_chars=snippet_chars,
+    )
+
+
+def _fallback_result(query: str, evidence: List[ChronoPassage]) -> Tuple[str, int]:
+    """Return the evidence-digest answer with its token estimate."""
+    clipped = _fallback_response(query, evidence).split(STOP_MARKER)[0].strip()
+    return clipped, max(1, len(clipped.split()))
+
+
+def _final_result(payload: Dict[str, Any]) -> Tuple[str, int]:
+    """Serialize a validated payload with its token estimate."""
+    # orjson emits compact UTF-8 by default, matching the old
+    # ensure_ascii=False / separators=(",", ":") output.
+    final_text = orjson.dumps(payload).decode()
+    return final_text, max(1, len(final_text.split()))
+
+
 def generate_answer(
     query: str,
     mode: str,
@@ -148,66 +296,26 @@ def generate_answer(
 ) -> Tuple[str, int]:
     """Generate an answer string and a token estimate from supplied evidence."""
     llm_cfg = models_cfg.get("llm", {})
-    prompt_limits = llm_cfg.get("prompt_limits", {})
-    max_passages = prompt_limits.get("max_passages")
-    snippet_chars = prompt_limits.get("snippet_chars", 180)
-    if not isinstance(snippet_chars, int) or snippet_chars <= 0:
-        snippet_chars = 180
-    prompt_evidence = evidence
-    if isinstance(max_passages, int) and max_passages > 0:
-        prompt_evidence = evidence[:max_passages]
-
-    stop_list = [STOP_MARKER]
-    max_tokens = 512
-    temperature = 0.15
+    _ANSWER_CACHE.bind_model(models_cfg.get("embeddings", {}).get("name"))
+    specs = _build_attempt_specs(evidence, llm_cfg)
+    # Fingerprint the primary prompt slice, not the full candidate list:
+    # retrieval tails beyond max_passages never reach the prompt and should
+    # not depress cache hit rates.
+    cache_context = _ANSWER_CACHE.context_key(mode, axis, window, domain, window_kind, specs[0][1])
+    logger.debug("evidence signature %s", cache_context.hex())
+    cached = _ANSWER_CACHE.get(query, cache_context)
+    if cached is not None:
+        return cached
     try:
         backend, backend_name = load_backend(llm_cfg)
-        if backend_name == "local_hf":
-            entry = llm_cfg.get("local_hf", {})
-            stop_list = entry.get("stop", stop_list)
-            max_tokens = entry.get("max_new_tokens", max_tokens)
-            temperature = entry.get("temperature", temperature)
-        elif backend_name == "openai_compat":
-            entry = llm_cfg.get("openai_compat", {})
-            stop_list = entry.get("stop", stop_list)
-            max_tokens = entry.get("max_tokens", max_tokens)
-            temperature = entry.get("temperature", temperature)
-        elif backend_name == "llama_cpp":
-            entry = llm_cfg.get("llama_cpp", {})
-            stop_list = entry.get("stop", stop_list)
-            max_tokens = entry.get("max_new_tokens", max_tokens)
-            temperature = entry.get("temperature", temperature)
-        elif backend_name == "ollama":
-            entry = llm_cfg.get("ollama", {})
-            stop_list = entry.get("stop", stop_list)
-            max_tokens = entry.get("max_tokens", max_tokens)
-            temperature = entry.get("temperature", temperature)
+        stop_list, max_tokens, temperature = _resolve_generation_params(llm_cfg, backend_name)
 
         payload: Optional[Dict[str, Any]] = None
-        raw_text = ""
-        issues: List[str] = []
-
-        attempt_specs = [
-            ("primary", prompt_evidence, snippet_chars),
-        ]
-        retry_evidence = prompt_evidence[: min(len(prompt_evidence), 8)]
-        retry_snippet = min(snippet_chars, 100)
-        if retry_evidence and retry_evidence != prompt_evidence:
-            attempt_specs.append(("retry", retry_evidence, retry_snippet))
-
-        for tag, attempt_evidence, attempt_snippet in attempt_specs:
-            messages = build_messages(
-                query,
-                mode,
-                axis,
-                window,
-                attempt_evidence,
-                domain,
-                window_kind,
-                snippet_chars=attempt_snippet,
+        for tag, attempt_evidence, attempt_snippet in specs:
+            messages = _attempt_messages(
+                query, mode, axis, window, attempt_evidence, domain, window_kind, attempt_snippet
             )
-            _inject_json_instructions(messages)
-            payload, raw_text, issues = _run_structured_generation(
+            payload, _raw_text, issues = _run_structured_generation(
                 backend,
                 messages,
                 max_tokens=max_tokens,
@@ -220,15 +328,84 @@ def generate_answer(
 
         if payload is None:
             logger.warning("Structured generation failed after retries; using fallback digest")
-            clipped = _fallback_response(query, evidence).split(STOP_MARKER)[0].strip()
-            token_estimate = max(1, len(clipped.split()))
-            return clipped, token_estimate
+            return _fallback_result(query, evidence)
+        result = _final_result(payload)
+    except Exception:
+        logger.exception("LLM generation failed; returning evidence digest")
+        return _fallback_result(query, evidence)
+    # The cache write happens outside the generation try: a put failure must
+    # not silently replace a good structured answer with the fallback digest.
+    try:
+        _ANSWER_CACHE.put(query, cache_context, result)
+    except Exception:
+        logger.exception("Failed to cache generated answer")
+    return result
+
+
+async def agenerate_answer(
+    query: str,
+    mode: str,
+    axis: str,
+    window: TimeWindow,
+    evidence: List[ChronoPassage],
+    models_cfg: Dict,
+    domain: str,
+    window_kind: str,
+) -> Tuple[str, int]:
+    """Async counterpart of :func:`generate_answer`.
+
+    HTTP backends issue requests on a shared pooled client, so callers can
+    asyncio.gather several generations and overlap the network round-trips
+    instead of serializing them.
+    """
+    llm_cfg = models_cfg.get("llm", {})
+    _ANSWER_CACHE.bind_model(models_cfg.get("embeddings", {}).get("name"))
+    specs = _build_attempt_specs(evidence, llm_cfg)
+    cache_context = _ANSWER_CACHE.context_key(mode, axis, window, domain, window_kind, specs[0][1])
+    logger.debug("evidence signature %s", cache_context.hex())
+    cached = _ANSWER_CACHE.get(query, cache_context)
+    if cached is not None:
+        return cached
+    try:
+        backend, backend_name = load_backend(llm_cfg)
+        stop_list, max_tokens, temperature = _resolve_generation_params(llm_cfg, backend_name)
+
+        # Fire all attempts concurrently: the retry round-trip overlaps the
+        # primary instead of waiting for it to fail, so a failed primary
+        # costs one round-trip of wall time instead of two.  Preference
+        # order is preserved — the retry result is only used when the
+        # primary payload does not validate.
+        attempts = [
+            _arun_structured_generation(
+                backend,
+                _attempt_messages(
+                    query, mode, axis, window, attempt_evidence, domain, window_kind, attempt_snippet
+                ),
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stop_list=stop_list,
+            )
+            for _tag, attempt_evidence, attempt_snippet in specs
+        ]
+        results = await asyncio.gather(*attempts)
 
-        final_text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-        token_estimate = max(1, len(final_text.split()))
-        return final_text, token_estimate
+        payload: Optional[Dict[str, Any]] = None
+        for (tag, _ev, _snip), (attempt_payload, _raw_text, issues) in zip(specs, results):
+            if attempt_payload is not None:
+                payload = attempt_payload
+                break
+            logger.warning("Structured generation %s attempt failed: %s", tag, issues)
+
+        if payload is None:
+            logger.warning("Structured generation failed after retries; using fallback digest")
+            return _fallback_result(query, evidence)
+        result = _final_result(payload)
     except Exception:
         logger.exception("LLM generation failed; returning evidence digest")
-        clipped = _fallback_response(query, evidence).split(STOP_MARKER)[0].strip()
-        token_estimate = max(1, len(clipped.split()))
-        return clipped, token_estimate
+        return _fallback_result(query, evidence)
+    # As in generate_answer: cache writes never run inside the fallback try.
+    try:
+        _ANSWER_CACHE.put(query, cache_context, result)
+    except Exception:
+        logger.exception("Failed to cache generated answer")
+    return result
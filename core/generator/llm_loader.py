@@ -2,10 +2,13 @@
 
 from typing import Protocol, List, Dict, Optional
 import os
+import threading
 
 import httpx
 import logging
 
+import orjson
+
 
 class LLMBackend(Protocol):
     def generate(
@@ -19,13 +22,73 @@ class LLMBackend(Protocol):
 
 logger = logging.getLogger(__name__)
 
+# Shared async client for the HTTP backends: connection pooling means
+# concurrent generate calls reuse sockets instead of re-handshaking.
+_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the lazily created process-wide AsyncClient."""
+    global _ASYNC_CLIENT
+    if _ASYNC_CLIENT is None:
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            timeout=60,
+            limits=httpx.Limits(max_connections=64),
+        )
+    return _ASYNC_CLIENT
+
+
+class _JsonClosureTracker:
+    """Detects when streamed text balances its first top-level JSON value.
+
+    Structured answers are single JSON objects and judge responses are
+    arrays of score objects, so generation past the balancing '}' or ']'
+    is wasted tokens; feed() returns True the moment the outermost value
+    closes.  Brackets inside string literals (and escapes) are ignored.
+    """
+
+    __slots__ = ("_depth", "_in_string", "_escaped", "_seen_open")
+
+    def __init__(self) -> None:
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._seen_open = False
+
+    def feed(self, chunk: str) -> bool:
+        for char in chunk:
+            if self._escaped:
+                self._escaped = False
+            elif char == "\\":
+                if self._in_string:
+                    self._escaped = True
+            elif char == '"':
+                self._in_string = not self._in_string
+            elif not self._in_string:
+                if char in "{[":
+                    self._depth += 1
+                    self._seen_open = True
+                elif char in "}]":
+                    self._depth -= 1
+                    if self._seen_open and self._depth <= 0:
+                        return True
+        return False
+
 
 class OpenAICompat:
     def __init__(self, endpoint: str, api_key: str, model: str):
         self.endpoint, self.api_key, self.model = endpoint, api_key, model
+        # Persistent client: keep-alive connections skip the TCP/TLS
+        # handshake that module-level httpx.post pays on every call.
+        self._client = httpx.Client(timeout=60)
 
-    def generate(self, messages, max_tokens, temperature, stop=None) -> str:
-        """Invoke any OpenAI-compatible /chat/completions endpoint."""
+    def __del__(self):
+        try:
+            self._client.close()
+        except Exception:
+            pass
+
+    def _request(self, messages, max_tokens, temperature, stop):
         if not self.endpoint or not self.api_key:
             raise RuntimeError("OpenAI-compatible not configured")
         payload = {
@@ -37,14 +100,37 @@ class OpenAICompat:
         if stop:
             payload["stop"] = stop
         headers = {"Authorization": f"Bearer {self.api_key}"}
-        response = httpx.post(
-            f"{self.endpoint}/chat/completions",
-            json=payload,
-            headers=headers,
-            timeout=60,
-        )
+        return f"{self.endpoint}/chat/completions", payload, headers
+
+    def generate(self, messages, max_tokens, temperature, stop=None) -> str:
+        """Invoke any OpenAI-compatible /chat/completions endpoint."""
+        url, payload, headers = self._request(messages, max_tokens, temperature, stop)
+        # Stream the completion and cut the server off once the structured
+        # JSON object closes — max_tokens is a ceiling, not a target.
+        payload["stream"] = True
+        tracker = _JsonClosureTracker()
+        parts: List[str] = []
+        with self._client.stream("POST", url, json=payload, headers=headers) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                piece = orjson.loads(data)["choices"][0].get("delta", {}).get("content")
+                if piece:
+                    parts.append(piece)
+                    if tracker.feed(piece):
+                        break
+        return "".join(parts)
+
+    async def agenerate(self, messages, max_tokens, temperature, stop=None) -> str:
+        """Async variant of :meth:`generate` on the shared pooled client."""
+        url, payload, headers = self._request(messages, max_tokens, temperature, stop)
+        response = await _get_async_client().post(url, json=payload, headers=headers)
         response.raise_for_status()
-        return response.json()["choices"][0]["message"]["content"]
+        return orjson.loads(response.content)["choices"][0]["message"]["content"]
 
 
 class LlamaCppBackend:
@@ -69,25 +155,57 @@ class LlamaCppBackend:
 
 
 class OllamaBackend:
+    # Server-side concurrency requires OLLAMA_NUM_PARALLEL > 1 on the host;
+    # otherwise concurrent agenerate calls queue behind a single slot.
     def __init__(self, model: str, host: str = "http://localhost:11434"):
         self.model, self.host = model, host
+        self._client = httpx.Client(timeout=60)
 
-    def generate(self, messages, max_tokens, temperature, stop=None) -> str:
-        response = httpx.post(
-            f"{self.host}/api/chat",
-            json={
-                "model": self.model,
-                "messages": messages,
-                "options": {
-                    "temperature": temperature,
-                    "num_predict": max_tokens,
-                    "stop": stop or [],
-                },
+    def __del__(self):
+        try:
+            self._client.close()
+        except Exception:
+            pass
+
+    def _request(self, messages, max_tokens, temperature, stop):
+        return f"{self.host}/api/chat", {
+            "model": self.model,
+            "messages": messages,
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+                "stop": stop or [],
             },
-            timeout=60,
-        )
+        }
+
+    def generate(self, messages, max_tokens, temperature, stop=None) -> str:
+        url, payload = self._request(messages, max_tokens, temperature, stop)
+        # Ollama streams NDJSON chunks; stop pulling once the JSON answer
+        # object balances instead of letting it run to num_predict.
+        payload["stream"] = True
+        tracker = _JsonClosureTracker()
+        parts: List[str] = []
+        with self._client.stream("POST", url, json=payload) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = orjson.loads(line)
+                piece = data.get("message", {}).get("content")
+                if piece:
+                    parts.append(piece)
+                    if tracker.feed(piece):
+                        break
+                if data.get("done"):
+                    break
+        return "".join(parts)
+
+    async def agenerate(self, messages, max_tokens, temperature, stop=None) -> str:
+        """Async variant of :meth:`generate` on the shared pooled client."""
+        url, payload = self._request(messages, max_tokens, temperature, stop)
+        response = await _get_async_client().post(url, json=payload)
         response.raise_for_status()
-        return response.json()["message"]["content"]
+        return orjson.loads(response.content)["message"]["content"]
 
 
 class LocalHFBackend:
@@ -164,18 +282,23 @@ class LocalHFBackend:
         import torch
 
         prompt = self.tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+        # The tokenizer output includes attention_mask alongside input_ids.
         inputs = self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
         gen_kwargs = {
             "max_new_tokens": max_tokens,
             "temperature": max(temperature, 1e-5),
             "do_sample": temperature > 0,
         }
-        outputs = self.model.generate(
-            **inputs,
-            **gen_kwargs,
-            use_cache=False,
-            pad_token_id=self.tokenizer.pad_token_id,
-        )
+        # use_cache keeps the KV cache alive during decoding (each new token
+        # attends over cached keys instead of recomputing the full context);
+        # inference_mode skips autograd bookkeeping.
+        with torch.inference_mode():
+            outputs = self.model.generate(
+                **inputs,
+                **gen_kwargs,
+                use_cache=True,
+                pad_token_id=self.tokenizer.pad_token_id,
+            )
         completion = outputs[0][inputs["input_ids"].shape[1]:]
         text = self.tokenizer.decode(completion, skip_special_tokens=True).strip()
         if stop:
@@ -185,8 +308,35 @@ class LocalHFBackend:
         return text
 
 
+# Constructed backends keyed by the config dict's identity: LocalHF and
+# llama.cpp load model weights in __init__, so rebuilding per call would pay
+# seconds of warmup on every answer.  Each entry stores the cfg object
+# alongside the backend — the strong reference pins its id, and the identity
+# check below rejects a new cfg that happens to land at a recycled address.
+_BACKEND_CACHE: Dict[int, tuple] = {}
+_BACKEND_CACHE_LOCK = threading.Lock()
+
+
 def load_backend(cfg) -> tuple[LLMBackend, str]:
-    """Return the first working backend defined by the strategy order."""
+    """Return the first working backend defined by the strategy order.
+
+    The selected backend is memoized per config object so repeated calls
+    reuse the same instance instead of re-importing frameworks or reloading
+    weights; the lock stops concurrent first calls from loading twice.
+    """
+    cached = _BACKEND_CACHE.get(id(cfg))
+    if cached is not None and cached[0] is cfg:
+        return cached[1]
+    with _BACKEND_CACHE_LOCK:
+        cached = _BACKEND_CACHE.get(id(cfg))
+        if cached is not None and cached[0] is cfg:
+            return cached[1]
+        result = _select_backend(cfg)
+        _BACKEND_CACHE[id(cfg)] = (cfg, result)
+        return result
+
+
+def _select_backend(cfg) -> tuple[LLMBackend, str]:
     order = cfg["strategy_order"]
     for name in order:
         try:
@@ -197,6 +347,8 @@ def load_backend(cfg) -> tuple[LLMBackend, str]:
                 if endpoint and api_key:
                     return OpenAICompat(endpoint, api_key, entry["model"]), "openai_compat"
             elif name == "local_hf":
+                if os.environ.get("CHRONORAG_NO_LOCAL_HF"):
+                    continue
                 entry = cfg["local_hf"]
                 path = entry.get("model_path")
                 allow_remote = entry.get("allow_remote", False)
@@ -3,11 +3,16 @@
 The generator receives structured passages and timing metadata; this module turns
 that into stable system/user messages that every LLM backend understands.  We keep
 the formatting expressive but deterministic so we can diff prompts across runs.
+
+Message layout is prefix-stable: immutable instructions come first, the evidence
+block (sorted deterministically) second, and the volatile query-bearing message
+last, so backends with prompt/KV caching can reuse the prefill for the shared
+leading tokens across requests.
 """
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, NamedTuple, Optional, Tuple
 
 from app.utils.chrono_reducer import ChronoPassage
 from app.utils.time_windows import TimeWindow
@@ -29,6 +34,87 @@ DOMAIN_NOTES = {
     )
 }
 
+JSON_INSTRUCTION = (
+    "Respond ONLY with minified JSON matching this schema:\n"
+    '{"range":{"low":number,"high":number,"most_likely":number,"unit":"1990_intl_usd"},'
+    '"bullets":[{"summary":string,"source":string},{"summary":string,"source":string}]}\n'
+    "- Use floats for numeric fields and ensure low <= most_likely <= high.\n"
+    "- Summaries must mention the referenced year (YYYY) and stay within 20 words.\n"
+    "- Sources must be concise citations or URIs.\n"
+    "- Do not emit any text outside the JSON object."
+)
+
+
+class PassageColumns(NamedTuple):
+    """Parallel columns over an evidence list, pre-sorted and pre-formatted."""
+
+    texts: Tuple[str, ...]
+    start_isos: Tuple[str, ...]
+    end_isos: Tuple[str, ...]
+    uris: Tuple[str, ...]
+    scores: Tuple[float, ...]
+    units: Tuple[str, ...]
+    entities: Tuple[str, ...]
+    regions: Tuple[str, ...]
+
+
+# Last (passages, columns) pair: attempts within a request can rebuild
+# prompts over the same passages, so the column extraction is reused.  The
+# snapshot holds the passage objects themselves — strong references keep
+# their ids from being recycled, so the identity comparison below cannot
+# confuse a freed passage with a new one at the same address.
+_COLUMNS_SNAPSHOT: Optional[Tuple[Tuple[ChronoPassage, ...], PassageColumns]] = None
+
+
+def to_columns(passages: List[ChronoPassage]) -> PassageColumns:
+    """Return an SoA view of the passages, memoized on their identities.
+
+    Sorting, date formatting, and the units/entities joins happen once here,
+    so the prompt builder's loop is a flat zip with no attribute chasing.
+    """
+    global _COLUMNS_SNAPSHOT
+    snapshot = _COLUMNS_SNAPSHOT
+    if (
+        snapshot is not None
+        and len(snapshot[0]) == len(passages)
+        and all(cached is current for cached, current in zip(snapshot[0], passages))
+    ):
+        return snapshot[1]
+    ordered = sorted(passages, key=lambda p: (p.uri, p.valid_window.start_ts))
+    columns = PassageColumns(
+        texts=tuple(p.text for p in ordered),
+        start_isos=tuple(p.valid_window.start_date_iso for p in ordered),
+        end_isos=tuple(p.valid_window.end.date().isoformat() for p in ordered),
+        uris=tuple(p.uri for p in ordered),
+        scores=tuple(p.score for p in ordered),
+        units=tuple(", ".join(p.units) if p.units else "n/a" for p in ordered),
+        entities=tuple(", ".join(p.entities) if p.entities else "n/a" for p in ordered),
+        regions=tuple(
+            p.region or p.facets.get("region") or p.facets.get("domain", "n/a") for p in ordered
+        ),
+    )
+    _COLUMNS_SNAPSHOT = (tuple(passages), columns)
+    return columns
+
+
+def build_evidence_block(evidence: List[ChronoPassage], snippet_chars: int = 180) -> str:
+    """Format the evidence passages into a deterministic, cache-friendly block.
+
+    Passages are sorted by URI (then start date) so the same evidence set
+    always yields byte-identical text regardless of retrieval ordering; rank
+    information is preserved in each line's score.
+    """
+    cols = to_columns(evidence)
+    lines = ["Evidence (scored, sorted by source):"]
+    append = lines.append
+    for text, start_iso, end_iso, uri, score, units, entities, region in zip(
+        cols.texts, cols.start_isos, cols.end_isos, cols.uris, cols.scores,
+        cols.units, cols.entities, cols.regions,
+    ):
+        append(f"- [{score:.2f}] {start_iso} → {end_iso}: {text[:snippet_chars]} — {uri}")
+        append(f"  Units: {units} • Entities: {entities} • Region: {region}")
+    return "\n".join(lines)
+
 
 def build_user_prompt(
     query: str,
@@ -40,27 +126,18 @@ def build_user_prompt(
     window_kind: str,
     snippet_chars: int = 180,
 ) -> str:
-    """Format a detailed user message capturing mode, axis, window, and evidence."""
-    lines = [
-        f"[MODE] {mode} • [AXIS] {axis} • [WINDOW] {window.start.date()} → {window.end.date()} • [DOMAIN] {domain} • [WINDOW_KIND] {window_kind}"
-    ]
-    lines.append(f"Question: {query}")
-    lines.append("Evidence (ranked):")
-    for passage in evidence:
-        units = ", ".join(passage.units) if passage.units else "n/a"
-        entities = ", ".join(passage.entities) if passage.entities else "n/a"
-        region = passage.region or passage.facets.get("region") or passage.facets.get("domain", "n/a")
-        snippet = passage.text[:snippet_chars]
-        lines.append(
-            "- [{score:.2f}] {window}: {text} — {uri}".format(
-                score=passage.score,
-                window=f"{passage.valid_window.start.date()} → {passage.valid_window.end.date()}",
-                text=snippet,
-                uri=passage.uri,
-            )
-        )
-        lines.append(f"  Units: {units} • Entities: {entities} • Region: {region}")
-    return "\n".join(lines)
+    """Format a detailed user message capturing mode, axis, window, and evidence.
+
+    Retained for callers that want a single flat prompt; :func:`build_messages`
+    uses the split prefix-stable layout instead.
+    """
+    header = (
+        f"[MODE] {mode} • [AXIS] {axis} • [WINDOW] {window.start.date()} → {window.end.date()} "
+        f"• [DOMAIN] {domain} • [WINDOW_KIND] {window_kind}"
+    )
+    return "\n".join(
+        [header, f"Question: {query}", build_evidence_block(evidence, snippet_chars=snippet_chars)]
+    )
 
 
 def build_messages(
@@ -73,23 +150,25 @@ def build_messages(
     window_kind: str,
     snippet_chars: int = 180,
 ) -> List[dict]:
-    """Return the system/user message pair consumed by downstream LLM backends."""
+    """Return prefix-stable messages consumed by downstream LLM backends.
+
+    Three messages, ordered from least to most volatile: static instructions
+    (per domain), the deterministic evidence block (stable across identical
+    retrieval sets), and finally the query-bearing user message.
+    """
     system_prompt = BASE_SYSTEM_PROMPT
     if domain in DOMAIN_NOTES:
         system_prompt = f"{system_prompt} {DOMAIN_NOTES[domain]}"
+    system_prompt = f"{system_prompt}\n\n{JSON_INSTRUCTION}"
     return [
         {"role": "system", "content": system_prompt},
+        {"role": "system", "content": build_evidence_block(evidence, snippet_chars=snippet_chars)},
         {
             "role": "user",
-            "content": build_user_prompt(
-                query,
-                mode,
-                axis,
-                window,
-                evidence,
-                domain,
-                window_kind,
-                snippet_chars=snippet_chars,
+            "content": (
+                f"[MODE] {mode} • [AXIS] {axis} • [WINDOW] {window.start.date()} → {window.end.date()} "
+                f"• [DOMAIN] {domain} • [WINDOW_KIND] {window_kind}\n"
+                f"Question: {query}"
             ),
         },
     ]
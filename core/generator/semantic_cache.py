@@ -0,0 +1,128 @@
+"""Semantic response cache that lets repeat or paraphrased queries skip the LLM.
+
+Entries are stored under an exact BLAKE2b key of (query, prompt context); a
+second tier falls back to embedding similarity over cached queries that share
+the same context, so a paraphrase of a recently answered question reuses the
+stored payload instead of paying for another generation round-trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+from core.retrieval.vector_ann import get_encoder
+
+
+class SemanticAnswerCache:
+    """Bounded two-tier (exact + embedding similarity) answer cache.
+
+    The context key binds every non-query prompt input — mode, axis, window
+    bounds, domain, and evidence URIs — so semantic matches can only reuse an
+    answer produced from identical evidence; fresh ingests change the URIs
+    and naturally miss.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        similarity_threshold: float = 0.95,
+        model_name: Optional[str] = None,
+    ):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        # The encoder is resolved lazily from the configured model name so
+        # the similarity tier shares the exact encoder instance the ANN
+        # index loaded, instead of keying a second copy under a default.
+        self._model_name = model_name
+        self._encoder = None
+        # exact key -> (context key, normalized query vector, cached value)
+        self._entries: "OrderedDict[bytes, Tuple[bytes, np.ndarray, Tuple[str, int]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bind_model(self, model_name: Optional[str]) -> None:
+        """Point the similarity tier at the configured embeddings model.
+
+        Vectors cached under a previous model are not comparable with the new
+        one, so a model change also drops the stored entries.
+        """
+        if not model_name or model_name == self._model_name:
+            return
+        self._model_name = model_name
+        self._encoder = None
+        with self._lock:
+            self._entries.clear()
+
+    def _encode(self, query: str) -> np.ndarray:
+        encoder = self._encoder
+        if encoder is None:
+            encoder = get_encoder(self._model_name) if self._model_name else get_encoder()
+            self._encoder = encoder
+        return encoder.encode([query])[0]
+
+    @staticmethod
+    def _digest(*parts: str) -> bytes:
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in parts:
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"|")
+        return hasher.digest()
+
+    def context_key(self, mode, axis, window, domain, window_kind, evidence) -> bytes:
+        """Fingerprint every prompt input except the query text itself.
+
+        Each passage contributes its URI and valid-window start, so a
+        re-versioned chunk under the same URI changes the fingerprint.
+        """
+        return self._digest(
+            mode,
+            axis,
+            domain,
+            window_kind,
+            repr(window.start_ts),
+            repr(window.end_ts),
+            *(f"{passage.uri}\x00{passage.valid_window.start_ts!r}" for passage in evidence),
+        )
+
+    def get(self, query: str, context: bytes) -> Optional[Tuple[str, int]]:
+        """Return a cached (text, tokens) result, or None on a full miss."""
+        exact = self._digest(query) + context
+        with self._lock:
+            entry = self._entries.get(exact)
+            if entry is not None:
+                self._entries.move_to_end(exact)
+                return entry[2]
+            # No same-context entry can possibly match, so skip the encode —
+            # this is the common case for an empty or freshly-cleared cache.
+            if not any(entry_context == context for entry_context, _, _ in self._entries.values()):
+                return None
+        # Similarity tier: encode outside the lock, then scan same-context
+        # entries.  The encoder is a stub hash in light mode and a fast
+        # sentence embedding otherwise — either way far cheaper than the LLM.
+        query_vec = self._encode(query)
+        with self._lock:
+            for entry_context, entry_vec, value in self._entries.values():
+                if entry_context != context:
+                    continue
+                if float(np.dot(entry_vec, query_vec)) >= self.similarity_threshold:
+                    return value
+        return None
+
+    def put(self, query: str, context: bytes, value: Tuple[str, int]) -> None:
+        """Store a generated result, evicting the oldest entry when full."""
+        exact = self._digest(query) + context
+        query_vec = self._encode(query)
+        with self._lock:
+            self._entries[exact] = (context, query_vec, value)
+            self._entries.move_to_end(exact)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached answers (policy updates, fresh ingests)."""
+        with self._lock:
+            self._entries.clear()
@@ -5,15 +5,32 @@ from __future__ import annotations
 import re
 from typing import Dict
 
+# Hoisted keyword tuples and the year regex: detect_intent runs per request
+# and should not rebuild its literals or hit re's compile cache each call.
+_MACRO_KEYWORDS = (
+    "gdp",
+    "per capita",
+    "historical statistics",
+    "maddison",
+    "19th century",
+    "18th century",
+    "world economy",
+    "industrial revolution",
+    "population 1820",
+)
+_MACRO_TERMS = ("gdp", "population", "growth", "economy")
+_ROLE_KEYWORDS = ("ceo", "chief executive", "leadership")
+_MACRO_YEAR_RE = re.compile(r"\b1[0-9]{3}\b")
+
 
 def detect_intent(query: str) -> Dict[str, str]:
     """Return a coarse intent dict (domain + target) inferred from the query."""
     q = query.lower()
-    if any(keyword in q for keyword in ["gdp", "per capita", "historical statistics", "maddison", "19th century", "18th century", "world economy", "industrial revolution", "population 1820"]):
+    if any(keyword in q for keyword in _MACRO_KEYWORDS):
         return {"domain": "world-economy", "target": "macro_history"}
-    if re.search(r"\b1[0-9]{3}\b", q) and any(term in q for term in ["gdp", "population", "growth", "economy"]):
+    if _MACRO_YEAR_RE.search(q) and any(term in q for term in _MACRO_TERMS):
         return {"domain": "world-economy", "target": "macro_history"}
-    if any(token in q for token in ["ceo", "chief executive", "leadership"]):
+    if any(token in q for token in _ROLE_KEYWORDS):
         return {"domain": "roles", "target": "leadership"}
     if "revenue" in q or "q2" in q:
         return {"domain": "finance", "target": "financials"}
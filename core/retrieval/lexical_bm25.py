@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import List, Sequence, Tuple
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 try:
     from rank_bm25 import BM25Okapi  # type: ignore
@@ -15,17 +18,76 @@ def tokenize(text: str) -> List[str]:
     return [tok.lower() for tok in text.split()]
 
 
+@lru_cache(maxsize=1024)
+def _tokenize_query(query: str) -> Tuple[str, ...]:
+    """Memoized query tokenisation; repeat queries skip the split/lower pass."""
+    return tuple(tokenize(query))
+
+
+class LexicalIndex:
+    """Persistent BM25 index that tokenizes each document once, at add time.
+
+    rank_bm25 cannot grow incrementally, so the BM25 model itself is rebuilt
+    lazily from the cached token lists when the corpus has changed; queries on
+    a stable corpus pay only for scoring the query tokens.
+    """
+
+    def __init__(self) -> None:
+        self._chunk_ids: List[str] = []
+        self._corpus_tokens: List[List[str]] = []
+        self._token_sets: List[set] = []
+        self._bm25: Optional[object] = None
+        self._dirty = False
+
+    def add(self, chunk_id: str, text: str) -> None:
+        """Tokenize and index a document; the BM25 model rebuilds on next search."""
+        tokens = tokenize(text)
+        self._chunk_ids.append(chunk_id)
+        self._corpus_tokens.append(tokens)
+        self._token_sets.append(set(tokens))
+        self._dirty = True
+
+    def clear(self) -> None:
+        """Drop all indexed documents."""
+        self._chunk_ids.clear()
+        self._corpus_tokens.clear()
+        self._token_sets.clear()
+        self._bm25 = None
+        self._dirty = False
+
+    def search(self, query: str, top_k: int = 5) -> List[Tuple[str, float]]:
+        """Return top-k lexical matches over the indexed corpus."""
+        if not self._chunk_ids:
+            return []
+        query_tokens = list(_tokenize_query(query))
+        if BM25Okapi is not None:
+            if self._bm25 is None or self._dirty:
+                self._bm25 = BM25Okapi(self._corpus_tokens)
+                self._dirty = False
+            scores = np.asarray(self._bm25.get_scores(query_tokens), dtype=np.float64)
+        else:
+            query_set = set(query_tokens)
+            scores = np.array(
+                [len(query_set & tokens) for tokens in self._token_sets],
+                dtype=np.float64,
+            )
+        top_k = min(top_k, len(scores))
+        # argpartition keeps the top-k selection O(N) before the small sort.
+        top = np.argpartition(scores, -top_k)[-top_k:]
+        top = top[np.argsort(scores[top])[::-1]]
+        return [(self._chunk_ids[idx], float(scores[idx])) for idx in top]
+
+
 def bm25_search(query: str, documents: Sequence[Tuple[str, str]], top_k: int = 5) -> List[Tuple[str, float]]:
-    """Return top-k lexical matches using BM25 when available, else a simple overlap proxy."""
+    """Return top-k lexical matches for a one-off document list.
+
+    Convenience wrapper over :class:`LexicalIndex` for ad-hoc corpora; callers
+    with a stable corpus should hold a LexicalIndex so the tokenisation and
+    BM25 construction amortise across queries.
+    """
     if not documents:
         return []
-    corpus_tokens = [tokenize(text) for _, text in documents]
-    if BM25Okapi is not None:
-        bm25 = BM25Okapi(corpus_tokens)
-        scores = bm25.get_scores(tokenize(query))
-    else:
-        query_tokens = set(tokenize(query))
-        scores = [len(query_tokens.intersection(set(tokens))) for tokens in corpus_tokens]
-    paired = [(doc_id, float(score)) for (doc_id, _), score in zip(documents, scores)]
-    ranked = sorted(paired, key=lambda x: x[1], reverse=True)
-    return ranked[:top_k]
+    index = LexicalIndex()
+    for doc_id, text in documents:
+        index.add(doc_id, text)
+    return index.search(query, top_k=top_k)
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import List, Tuple
 
+import numpy as np
+
 from app.light_mode import light_mode_enabled
 
 
@@ -45,15 +47,13 @@ class CEReranker:
             scores.sort(key=lambda item: item[1], reverse=True)
             return scores
 
-        import math
-
-        pairs = [[query, passage] for passage in passages]
-        scores: List[Tuple[int, float]] = []
-        for start in range(0, len(pairs), self.batch_size):
-            batch = pairs[start : start + self.batch_size]
-            batch_scores = self._model.predict(batch, convert_to_numpy=True).tolist()
-            for offset, score in enumerate(batch_scores):
-                logistic = float(1 / (1 + math.exp(-score)))
-                scores.append((start + offset, logistic))
-        scores.sort(key=lambda item: item[1], reverse=True)
-        return scores
+        # Group similar-length passages into the same batch so the tokenizer
+        # pads each batch to its own longest member rather than the global max;
+        # scores are mapped back to the caller's original indices afterwards.
+        # predict() handles the batch splitting internally in one call.
+        order = sorted(range(len(passages)), key=lambda idx: len(passages[idx]))
+        pairs = [[query, passages[idx]] for idx in order]
+        raw = self._model.predict(pairs, batch_size=self.batch_size, convert_to_numpy=True)
+        logistic = 1.0 / (1.0 + np.exp(-np.asarray(raw, dtype=np.float64)))
+        ranked = np.argsort(-logistic, kind="stable")
+        return [(order[int(pos)], float(logistic[pos])) for pos in ranked]
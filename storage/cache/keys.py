@@ -1,2 +1,16 @@
+"""Stable Redis key derivation for the answer/judge caches."""
+
+import hashlib
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
 def make_cache_key(tenant: str, query: str, axis: str, window: str) -> str:
-    return f"chronorag:{tenant}:{axis}:{window}:{hash(query)}"
+    """Return a cache key that is stable across processes and restarts.
+
+    The query is digested with BLAKE2b rather than the built-in ``hash``,
+    which is randomised per process (PYTHONHASHSEED) and would give every
+    worker its own key space — silently zeroing the shared-cache hit rate.
+    """
+    digest = hashlib.blake2b(query.encode("utf-8"), digest_size=16).hexdigest()
+    return f"chronorag:{tenant}:{axis}:{window}:{digest}"
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import json
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
+
+import orjson
 
 try:  # pragma: no cover - optional dependency
     import redis
@@ -20,7 +21,7 @@ class CacheClient:
                 self.client = None
 
     def set(self, key: str, value: Any, ex: Optional[int] = None) -> None:
-        payload = json.dumps(value)
+        payload = orjson.dumps(value)
         if self.client:
             try:
                 self.client.set(key, payload, ex=ex)
@@ -29,16 +30,53 @@ class CacheClient:
                 pass
         self.fallback[key] = payload
 
+    def set_many(self, mapping: Dict[str, Any], ex: Optional[int] = None) -> None:
+        """Write several keys in one round-trip via a Redis pipeline.
+
+        MSET has no per-key TTL, so a pipeline of SETs is used instead; the
+        in-memory fallback simply stores each entry.
+        """
+        payloads = {key: orjson.dumps(value) for key, value in mapping.items()}
+        if self.client:
+            try:
+                pipe = self.client.pipeline(transaction=False)
+                for key, payload in payloads.items():
+                    pipe.set(key, payload, ex=ex)
+                pipe.execute()
+                return
+            except Exception:  # pragma: no cover
+                pass
+        self.fallback.update(payloads)
+
+    def get_many(self, keys: List[str]) -> List[Any | None]:
+        """Fetch several keys in one MGET round-trip; missing keys map to None.
+
+        Mirrors :meth:`get`: Redis misses (or an unavailable client) fall
+        through to the in-memory fallback per key.
+        """
+        values: List[Any] = [None] * len(keys)
+        if self.client:
+            try:
+                values = self.client.mget(keys)
+            except Exception:  # pragma: no cover
+                values = [None] * len(keys)
+        results: List[Any | None] = []
+        for key, value in zip(keys, values):
+            if value is None:
+                value = self.fallback.get(key)
+            results.append(orjson.loads(value) if value is not None else None)
+        return results
+
     def get(self, key: str) -> Any | None:
         if self.client:
             try:
                 value = self.client.get(key)
                 if value is not None:
-                    return json.loads(value)
+                    return orjson.loads(value)
             except Exception:  # pragma: no cover
                 pass
         payload = self.fallback.get(key)
-        return json.loads(payload) if payload else None
+        return orjson.loads(payload) if payload else None
 
     def clear(self) -> None:
         if self.client:
@@ -2,14 +2,99 @@
 
 from __future__ import annotations
 
+import atexit
+import hashlib
+import os
 import uuid
-import json
+import queue
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from app.utils.time_windows import TimeWindow, hard_mode_pre_mask, intelligent_decay
+import numpy as np
+import orjson
+
+from app.utils.time_windows import TimeWindow, intelligent_decay_batch
+from core.retrieval.lexical_bm25 import LexicalIndex
 from core.retrieval.vector_ann import InMemoryANNIndex
-from .models import ChunkRecord, DocumentRecord
+from .models import ChunkRecord, DocumentRecord, _intern, _intern_list, _intern_map
+
+# Background flusher knobs: persist once this much new payload accumulates or
+# this much time has passed since the last flush, whichever comes first.
+FLUSH_BYTES = 8 * 1024 * 1024
+FLUSH_INTERVAL_SECONDS = 30.0
+
+
+def _content_fingerprint(text: str, uri: str, version_id: Optional[str]) -> bytes:
+    """Stable digest of a chunk's identity-bearing content.
+
+    BLAKE2b rather than hash(): the built-in is salted per process, so a
+    fingerprint index built on it could never recognise a re-ingest after a
+    restart.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(uri.encode("utf-8"))
+    hasher.update(b"\x00")
+    hasher.update((version_id or "").encode("utf-8"))
+    hasher.update(b"\x00")
+    hasher.update(text.encode("utf-8"))
+    return hasher.digest()
+
+
+class _AsyncFlusher:
+    """Flushes PVDB snapshots on a background thread.
+
+    Callers enqueue flush requests and return immediately; the worker persists
+    when either the pending-bytes threshold or the flush interval is reached,
+    amortising disk I/O across many ingests.  ``drain`` flushes synchronously
+    and is registered via atexit so shutdown never loses a dirty snapshot.
+    """
+
+    def __init__(self, pvdb: "PVDB", flush_bytes: int = FLUSH_BYTES, flush_interval: float = FLUSH_INTERVAL_SECONDS):
+        self._pvdb = pvdb
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[None]" = queue.Queue()
+        self._pending_bytes = 0
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def request(self, pending_bytes: int = 0) -> None:
+        """Record pending payload bytes and wake the worker without blocking."""
+        with self._lock:
+            self._pending_bytes += pending_bytes
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="pvdb-flusher", daemon=True)
+                self._thread.start()
+                atexit.register(self.drain)
+        self._queue.put(None)
+
+    def drain(self) -> None:
+        """Persist any dirty state synchronously (purge/shutdown path)."""
+        with self._lock:
+            self._pending_bytes = 0
+        self._pvdb.flush()
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        while True:
+            timeout = max(0.1, self.flush_interval - (time.monotonic() - last_flush))
+            try:
+                self._queue.get(timeout=timeout)
+            except queue.Empty:
+                pass
+            with self._lock:
+                due = (
+                    self._pending_bytes >= self.flush_bytes
+                    or time.monotonic() - last_flush >= self.flush_interval
+                )
+                if due:
+                    self._pending_bytes = 0
+            if due:
+                self._pvdb.flush()
+                last_flush = time.monotonic()
 
 
 class PVDB:
@@ -19,18 +104,47 @@ class PVDB:
         self.documents: Dict[str, DocumentRecord] = {}
         self.chunks: Dict[str, ChunkRecord] = {}
         self.ann = InMemoryANNIndex(model_cfg["embeddings"]["name"])
+        self.lexical = LexicalIndex()
         self.external_index: Dict[str, str] = {}
+        # Content fingerprint -> chunk_id, so re-ingesting identical payloads
+        # (same uri/version/text) is idempotent and skips the embedding pass.
+        self._content_index: Dict[bytes, str] = {}
+        # Non-None while a bulk_ingest() context is open: chunks awaiting
+        # their embedding, drained through one batched encode on exit.
+        self._bulk_pending: Optional[List[Tuple[str, str, Dict]]] = None
+        # Monotonic corpus version; bumped on any chunk mutation so callers
+        # can cache derived structures (doc lists, indexes) per generation.
+        self.generation: int = 0
         self._dirty: bool = False
         self.persist_path = persist_path
+        # Append-only write-ahead log beside the snapshot: each ingest
+        # appends one line instead of rewriting the whole snapshot, and the
+        # snapshot write compacts the log away.
+        self._log_path = persist_path.with_suffix(".log") if persist_path else None
+        # Embeddings live in a sidecar .npy beside the snapshot so load can
+        # mmap one contiguous matrix instead of decoding per-chunk payloads.
+        self._vectors_path = persist_path.with_suffix(".vecs.npy") if persist_path else None
+        self._log_file = None
+        self._log_bytes = 0
+        self._snapshot_bytes = 0
+        self._log_lock = threading.Lock()
+        self._flusher = _AsyncFlusher(self)
         if self.persist_path:
+            try:
+                self._snapshot_bytes = self.persist_path.stat().st_size
+            except OSError:
+                pass
             self._load_from_disk()
 
     def clear(self) -> None:
         """Destroy all documents/chunks and reset the ANN index."""
         self.documents.clear()
         self.chunks.clear()
-        self.ann.entries.clear()
+        self.ann.clear()
+        self.lexical.clear()
         self.external_index.clear()
+        self._content_index.clear()
+        self.generation += 1
         self._dirty = True
         self._persist(force=True)
 
@@ -42,6 +156,7 @@ class PVDB:
             self.documents[doc_id] = document
         document.metadata.update(updates)
         self._dirty = True
+        self._append_log({"op": "doc_meta", "doc_id": doc_id, "updates": updates})
 
     # ingest
     def ingest_document(
@@ -62,8 +177,21 @@ class PVDB:
         units: Optional[List[str]] = None,
         time_granularity: Optional[str] = None,
         time_sigma_days: Optional[int] = None,
+        embedding_vector: Optional[np.ndarray] = None,
     ) -> ChunkRecord:
-        """Store a new chunk, assign ANN embedding, and maintain external-id lineage."""
+        """Store a new chunk, assign ANN embedding, and maintain external-id lineage.
+
+        ``embedding_vector`` is supplied by :meth:`ingest_documents` so batched
+        ingests encode all chunk texts in one model pass instead of per chunk.
+        Re-ingesting a payload whose (uri, version, text) fingerprint is
+        already stored returns the existing chunk without re-embedding.
+        """
+        fingerprint = _content_fingerprint(text, uri, version_id)
+        existing_id = self._content_index.get(fingerprint)
+        if existing_id is not None:
+            existing = self.chunks.get(existing_id)
+            if existing is not None:
+                return existing
         doc_key = doc_id or uuid.uuid4().hex
         document = self.documents.get(doc_key)
         if document is None:
@@ -74,16 +202,20 @@ class PVDB:
         self._dirty = True
 
         chunk_id = uuid.uuid4().hex
-        vector = self.ann.add(
-            chunk_id,
-            text,
-            {
-                "doc_id": doc_key,
-                "uri": uri,
-                "domain": (facets or {}).get("domain"),
-                "external_id": external_id,
-            },
-        )
+        ann_metadata = {
+            "doc_id": doc_key,
+            "uri": uri,
+            "domain": (facets or {}).get("domain"),
+            "external_id": external_id,
+        }
+        if self._bulk_pending is not None and embedding_vector is None:
+            # Inside bulk_ingest(): stage the chunk and defer its embedding
+            # so the drain encodes the whole session in one model pass. The
+            # chunk is invisible to ANN search until the context exits.
+            self._bulk_pending.append((chunk_id, text, ann_metadata))
+            vector = None
+        else:
+            vector = self.ann.add(chunk_id, text, ann_metadata, vector=embedding_vector)
 
         if external_id:
             previous_chunk_id = self.external_index.get(external_id)
@@ -100,32 +232,85 @@ class PVDB:
                             end=tx_end,
                         )
                     previous_chunk.version_id = previous_chunk.version_id or version_id
+                    self._append_log({"op": "upsert_chunk", "record": previous_chunk.to_dict()})
 
         payload = ChunkRecord(
             chunk_id=chunk_id,
-            doc_id=doc_key,
+            doc_id=_intern(doc_key),
             text=text,
-            uri=uri,
+            uri=_intern(uri),
             authority=authority,
             valid_window=valid_window,
             tx_window=tx_window,
             external_id=external_id,
             version_id=version_id,
-            facets=dict(facets or {}),
-            entities=list(entities or []),
-            tags=list(tags or []),
-            units=list(units or []),
-            time_granularity=time_granularity,
+            facets=_intern_map(facets or {}),
+            entities=_intern_list(entities or []),
+            tags=_intern_list(tags or []),
+            units=_intern_list(units or []),
+            time_granularity=_intern(time_granularity) if time_granularity else None,
             time_sigma_days=time_sigma_days,
-            embedding=vector.tolist(),
+            embedding=vector,
             extra=metadata or {},
         )
         self.chunks[chunk_id] = payload
+        self.lexical.add(chunk_id, text)
         if external_id:
             self.external_index[external_id] = chunk_id
+        self._content_index[fingerprint] = chunk_id
+        self.generation += 1
         self._dirty = True
+        self._append_log({"op": "upsert_doc", "record": document.to_dict()})
+        self._append_log({"op": "upsert_chunk", "record": payload.to_dict()})
         return payload
 
+    def ingest_documents(self, items: List[Dict[str, Any]]) -> List[ChunkRecord]:
+        """Ingest many chunks with a single batched embedding pass.
+
+        Each item is a kwargs dict for :meth:`ingest_document`; all texts are
+        encoded together so the transformer runs one batched forward pass
+        rather than N single-item passes.
+        """
+        if not items:
+            return []
+        vectors = self.ann.encoder.encode([item["text"] for item in items])
+        return [
+            self.ingest_document(**item, embedding_vector=vector)
+            for item, vector in zip(items, vectors)
+        ]
+
+    @contextmanager
+    def bulk_ingest(self):
+        """Defer per-chunk embedding inside the block, draining in one batch.
+
+        Chunks ingested while the context is open skip the per-call encode
+        and join the ANN index only when the block exits, via a single
+        batched forward pass. Nesting reuses the outermost session. The WAL
+        lines written during the block carry no embedding; replay re-encodes
+        missing vectors, so crash recovery is unaffected.
+        """
+        if self._bulk_pending is not None:
+            yield self
+            return
+        self._bulk_pending = []
+        try:
+            yield self
+        finally:
+            staged, self._bulk_pending = self._bulk_pending, None
+            self._drain_bulk(staged)
+
+    def _drain_bulk(self, staged: List[Tuple[str, str, Dict]]) -> None:
+        """Encode staged chunk texts together and attach the vectors."""
+        if not staged:
+            return
+        vectors = self.ann.encoder.encode([text for _, text, _ in staged])
+        for (chunk_id, text, metadata), vector in zip(staged, vectors):
+            self.ann.add(chunk_id, text, metadata, vector=vector)
+            chunk = self.chunks.get(chunk_id)
+            if chunk is not None:
+                chunk.embedding = vector
+        self._dirty = True
+
     def list_chunks(self) -> List[ChunkRecord]:
         """Return the full set of chunk records (used sparingly in tests/CLI)."""
         return list(self.chunks.values())
@@ -134,6 +319,10 @@ class PVDB:
         """Return chunk objects for a subset of ids, ignoring missing ones."""
         return [self.chunks[cid] for cid in chunk_ids if cid in self.chunks]
 
+    def lexical_search(self, query: str, top_k: int) -> List[Tuple[str, float]]:
+        """Query the persistent BM25 index built incrementally at ingest time."""
+        return self.lexical.search(query, top_k=top_k)
+
     def ann_search(self, query: str, top_k: int) -> List[Tuple[ChunkRecord, float]]:
         """Perform ANN search and convert results back into chunk instances."""
         results = self.ann.search(query, top_k=top_k)
@@ -150,52 +339,234 @@ class PVDB:
         query_window: TimeWindow,
         mode: str = "INTELLIGENT",
     ) -> List[Tuple[ChunkRecord, float]]:
-        """Filter candidate chunks by temporal overlap (HARD) or decay weighting."""
-        filtered = []
-        for chunk in chunks:
-            if mode == "HARD":
-                if hard_mode_pre_mask(chunk.valid_window, query_window):
-                    filtered.append((chunk, 1.0))
-            else:
-                weight = intelligent_decay(chunk.valid_window, query_window)
-                if weight > 0:
-                    filtered.append((chunk, weight))
-        return filtered
+        """Filter candidate chunks by temporal overlap (HARD) or decay weighting.
+
+        Works over cached epoch-second columns so masking and decay are a few
+        NumPy expressions rather than datetime arithmetic per chunk.
+        """
+        chunk_list = list(chunks)
+        if not chunk_list:
+            return []
+        count = len(chunk_list)
+        # fromiter with an explicit count fills the SoA columns directly
+        # from the cached per-chunk epoch seconds without an interim list.
+        starts = np.fromiter((chunk.valid_start_ts for chunk in chunk_list), dtype=np.float64, count=count)
+        ends = np.fromiter((chunk.valid_end_ts for chunk in chunk_list), dtype=np.float64, count=count)
+        if mode == "HARD":
+            overlap = (ends > query_window.start_ts) & (starts < query_window.end_ts)
+            return [(chunk_list[idx], 1.0) for idx in np.flatnonzero(overlap)]
+        weights = intelligent_decay_batch(starts, ends, query_window)
+        # Gather survivors via flatnonzero so zero-weight chunks never
+        # materialise result tuples.
+        return [(chunk_list[idx], float(weights[idx])) for idx in np.flatnonzero(weights > 0)]
 
     # persistence helpers
     def flush(self, force: bool = False) -> None:
         """Persist current state to disk when dirty or when force=True."""
         self._persist(force=force)
 
+    def request_flush(self, pending_bytes: int = 0) -> None:
+        """Queue an asynchronous flush and return without touching the disk."""
+        if not self.persist_path:
+            return
+        self._flusher.request(pending_bytes)
+
+    def drain_flushes(self) -> None:
+        """Synchronously persist anything the background flusher still holds."""
+        self._flusher.drain()
+
     def _persist(self, force: bool = False) -> None:
-        """Write a JSON snapshot of documents/chunks/external index."""
+        """Write a JSON snapshot of documents/chunks/external index.
+
+        Collections are copied via list()/dict() first so the background
+        flusher never iterates a dict that the ingest thread is resizing.
+        The snapshot is serialised with orjson and written to a sibling tmp
+        file swapped in via os.replace, so a crash mid-write never leaves a
+        truncated snapshot behind.
+        """
         if not self.persist_path:
             return
         if not self._dirty and not force:
             return
+        chunk_values = list(self.chunks.values())
+        chunk_dicts = [chunk.to_dict() for chunk in chunk_values]
+        # When every chunk has a vector, strip embeddings out of the JSON and
+        # write them as one fp16 matrix in snapshot row order; the sidecar
+        # mmaps at load instead of being base64-decoded chunk by chunk.
+        use_sidecar = bool(chunk_values) and all(chunk.embedding is not None for chunk in chunk_values)
+        if use_sidecar:
+            for item in chunk_dicts:
+                item["embedding"] = None
         snapshot = {
-            "documents": [doc.to_dict() for doc in self.documents.values()],
-            "chunks": [chunk.to_dict() for chunk in self.chunks.values()],
-            "external_index": self.external_index,
+            "documents": [doc.to_dict() for doc in list(self.documents.values())],
+            "chunks": chunk_dicts,
+            "external_index": dict(self.external_index),
         }
         self.persist_path.parent.mkdir(parents=True, exist_ok=True)
-        self.persist_path.write_text(json.dumps(snapshot), encoding="utf-8")
+        if use_sidecar:
+            matrix = np.stack([chunk.embedding for chunk in chunk_values], axis=0).astype(np.float16)
+            vec_tmp = self._vectors_path.with_name(self._vectors_path.stem + ".tmp.npy")
+            np.save(vec_tmp, matrix)
+            os.replace(vec_tmp, self._vectors_path)
+        elif self._vectors_path is not None:
+            try:
+                os.unlink(self._vectors_path)
+            except FileNotFoundError:
+                pass
+        payload = orjson.dumps(snapshot, option=orjson.OPT_SERIALIZE_NUMPY)
+        tmp_path = self.persist_path.with_suffix(self.persist_path.suffix + ".tmp")
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, self.persist_path)
         self._dirty = False
+        # Snapshot compaction: everything the log recorded is now in the
+        # snapshot, so the log starts over empty.
+        with self._log_lock:
+            if self._log_file is not None:
+                self._log_file.close()
+                self._log_file = None
+            if self._log_path is not None:
+                try:
+                    os.unlink(self._log_path)
+                except FileNotFoundError:
+                    pass
+            self._log_bytes = 0
+            self._snapshot_bytes = len(payload)
+
+    def _append_log(self, entry: Dict[str, Any]) -> None:
+        """Append one operation line to the write-ahead log.
+
+        Ingest persistence becomes O(1) per mutation; the full snapshot is
+        only rewritten by the flusher, which compacts the log away.  When the
+        log outgrows twice the last snapshot, a flush is requested so replay
+        time stays bounded.
+        """
+        if not self.persist_path:
+            return
+        line = orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+        with self._log_lock:
+            if self._log_file is None:
+                self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+                self._log_file = open(self._log_path, "ab")
+            self._log_file.write(line)
+            self._log_file.flush()
+            self._log_bytes += len(line)
+            compact_due = self._log_bytes > max(2 * self._snapshot_bytes, 1 << 20)
+        if compact_due:
+            self.request_flush(self._log_bytes)
+
+    def _replay_log(self) -> None:
+        """Re-apply logged operations recorded since the last snapshot."""
+        if not self._log_path:
+            return
+        try:
+            raw = self._log_path.read_bytes()
+        except OSError:
+            return
+        applied = False
+        for line in raw.splitlines():
+            if not line:
+                continue
+            try:
+                entry = orjson.loads(line)
+            except Exception:
+                continue  # torn tail write from a crash mid-append
+            op = entry.get("op")
+            if op == "upsert_doc":
+                document = DocumentRecord.from_dict(entry["record"])
+                self.documents[document.doc_id] = document
+            elif op == "doc_meta":
+                document = self.documents.get(entry["doc_id"])
+                if document is None:
+                    document = DocumentRecord(doc_id=entry["doc_id"], source_path=None, text="", metadata={})
+                    self.documents[document.doc_id] = document
+                document.metadata.update(entry.get("updates", {}))
+            elif op == "upsert_chunk":
+                chunk = ChunkRecord.from_dict(entry["record"])
+                if chunk.embedding is None:
+                    chunk.embedding = self.ann.encoder.encode([chunk.text])[0]
+                vector = np.asarray(chunk.embedding, dtype=np.float32)
+                vector = vector / (float(np.linalg.norm(vector)) or 1.0)
+                chunk.embedding = vector
+                existing = chunk.chunk_id in self.chunks
+                self.chunks[chunk.chunk_id] = chunk
+                if not existing:
+                    self.lexical.add(chunk.chunk_id, chunk.text)
+                self.ann.add(
+                    chunk.chunk_id,
+                    chunk.text,
+                    {
+                        "doc_id": chunk.doc_id,
+                        "uri": chunk.uri,
+                        "domain": chunk.facets.get("domain"),
+                        "external_id": chunk.external_id,
+                    },
+                    vector=vector,
+                )
+                if chunk.external_id:
+                    self.external_index[chunk.external_id] = chunk.chunk_id
+                self._content_index[_content_fingerprint(chunk.text, chunk.uri, chunk.version_id)] = chunk.chunk_id
+            applied = True
+        if applied:
+            self.generation += 1
+            # The snapshot is stale relative to the replayed state.
+            self._dirty = True
+            self._log_bytes = len(raw)
 
     def _load_from_disk(self) -> None:
-        """Initialise PVDB from an on-disk snapshot, rebuilding ANN vectors."""
-        if not self.persist_path or not self.persist_path.exists():
+        """Initialise PVDB from the snapshot, then replay the write-ahead log."""
+        if not self.persist_path:
+            return
+        self._load_snapshot()
+        self._replay_log()
+
+    def _load_snapshot(self) -> None:
+        # EAFP: one open instead of a stat-then-open pair; cold starts with
+        # no snapshot are the common case and cost a single failed syscall.
+        try:
+            raw = self.persist_path.read_bytes()
+        except OSError:
             return
         try:
-            payload = json.loads(self.persist_path.read_text(encoding="utf-8"))
+            payload = orjson.loads(raw)
         except Exception:
             return
-        docs = {item["doc_id"]: DocumentRecord.from_dict(item) for item in payload.get("documents", [])}
+        # Bind the hydrators once; the comprehensions then skip the per-item
+        # class attribute lookup.
+        from_doc = DocumentRecord.from_dict
+        from_chunk = ChunkRecord.from_dict
+        docs = {item["doc_id"]: from_doc(item) for item in payload.get("documents", [])}
+        records = [from_chunk(item) for item in payload.get("chunks", [])]
+        # Prefer the mmapped sidecar matrix (rows follow snapshot order) so
+        # vectors load without per-chunk base64 decoding; chunks it cannot
+        # cover keep any inline embedding from the JSON.
+        if self._vectors_path is not None:
+            try:
+                vectors = np.load(self._vectors_path, mmap_mode="r")
+            except Exception:
+                vectors = None
+            if vectors is not None and vectors.shape[0] == len(records):
+                for idx, chunk in enumerate(records):
+                    if chunk.embedding is None:
+                        chunk.embedding = np.asarray(vectors[idx], dtype=np.float32)
+        # Reuse persisted embeddings instead of re-running the model on
+        # already-embedded text; only chunks no snapshot artefact covers fall
+        # back to one batched encode pass.
+        pending = [chunk for chunk in records if chunk.embedding is None]
+        if pending:
+            encoded = self.ann.encoder.encode([chunk.text for chunk in pending])
+            for chunk, vector in zip(pending, encoded):
+                chunk.embedding = vector
         chunks = {}
-        for item in payload.get("chunks", []):
-            chunk = ChunkRecord.from_dict(item)
+        for chunk in records:
+            vector = np.asarray(chunk.embedding, dtype=np.float32)
+            # Re-normalise: the int8 snapshot round-trip perturbs the unit
+            # norm slightly and cosine search assumes normalised vectors.
+            vector = vector / (float(np.linalg.norm(vector)) or 1.0)
+            chunk.embedding = vector
             chunks[chunk.chunk_id] = chunk
-            vector = self.ann.add(
+            self._content_index[_content_fingerprint(chunk.text, chunk.uri, chunk.version_id)] = chunk.chunk_id
+            self.lexical.add(chunk.chunk_id, chunk.text)
+            self.ann.add(
                 chunk.chunk_id,
                 chunk.text,
                 {
@@ -204,9 +575,10 @@ class PVDB:
                     "domain": chunk.facets.get("domain"),
                     "external_id": chunk.external_id,
                 },
+                vector=vector,
             )
-            chunk.embedding = vector.tolist()
         self.documents = docs
         self.chunks = chunks
         self.external_index = payload.get("external_index", {})
+        self.generation += 1
         self._dirty = False
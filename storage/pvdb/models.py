@@ -2,14 +2,61 @@
 
 from __future__ import annotations
 
+import base64
 import datetime as dt
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+import numpy as np
+
 from app.utils.time_windows import TimeWindow
+from core.retrieval.vector_ann import quantize_int8
+
+
+# Interning deduplicates the high-repetition string fields (URIs, facet
+# keys/values, tags, units) across the whole chunk store and makes their
+# dict lookups pointer comparisons.
+_intern = sys.intern
+
+
+def _intern_map(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of ``mapping`` with keys and string values interned."""
+    return {_intern(key): _intern(value) if isinstance(value, str) else value for key, value in mapping.items()}
+
+
+def _intern_list(values: List[str]) -> List[str]:
+    """Return a copy of ``values`` with every string interned."""
+    return [_intern(value) for value in values]
 
 
-@dataclass
+def _encode_embedding(embedding: Optional[np.ndarray]) -> Optional[Dict[str, Any]]:
+    """Serialise an embedding as base64 int8 bytes plus a per-tensor scale.
+
+    A 768-dim float list JSON-encodes to roughly 8KB per chunk; raw int8
+    bytes in base64 are ~1KB with negligible retrieval accuracy loss.
+    """
+    if embedding is None:
+        return None
+    quantized, scale = quantize_int8(np.asarray(embedding, dtype=np.float32))
+    return {
+        "scale": scale,
+        "data": base64.b64encode(quantized.tobytes()).decode("ascii"),
+    }
+
+
+def _decode_embedding(payload: Any) -> Optional[np.ndarray]:
+    """Inverse of :func:`_encode_embedding`; accepts legacy float-list snapshots."""
+    if payload is None:
+        return None
+    if isinstance(payload, list):
+        return np.asarray(payload, dtype=np.float32)
+    raw = np.frombuffer(base64.b64decode(payload["data"]), dtype=np.int8)
+    return raw.astype(np.float32) * payload["scale"]
+
+
+@dataclass(slots=True)
 class DocumentRecord:
     """Container for document-level metadata."""
 
@@ -29,14 +76,14 @@ class DocumentRecord:
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "DocumentRecord":
         return cls(
-            doc_id=payload["doc_id"],
-            source_path=payload.get("source_path"),
-            text=payload.get("text", ""),
-            metadata=payload.get("metadata", {}),
+            payload["doc_id"],
+            payload.get("source_path"),
+            payload.get("text", ""),
+            payload.get("metadata", {}),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ChunkRecord:
     """Chunk-level record including time windows and metadata."""
 
@@ -55,8 +102,16 @@ class ChunkRecord:
     units: List[str] = field(default_factory=list)
     time_granularity: Optional[str] = None
     time_sigma_days: Optional[int] = None
-    embedding: Optional[list] = None
+    embedding: Optional[np.ndarray] = None
     extra: Dict = field(default_factory=dict)
+    # Epoch-second bounds of valid_window, cached once at construction so the
+    # hot temporal paths do pure float math instead of datetime arithmetic.
+    valid_start_ts: float = field(init=False, repr=False, default=0.0)
+    valid_end_ts: float = field(init=False, repr=False, default=0.0)
+
+    def __post_init__(self) -> None:
+        self.valid_start_ts = self.valid_window.start_ts
+        self.valid_end_ts = self.valid_window.end_ts
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -85,41 +140,45 @@ class ChunkRecord:
             "units": self.units,
             "time_granularity": self.time_granularity,
             "time_sigma_days": self.time_sigma_days,
-            "embedding": self.embedding,
+            "embedding": _encode_embedding(self.embedding),
             "extra": self.extra,
         }
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "ChunkRecord":
-        tx_payload = payload.get("tx_window")
+        # Hydration runs once per chunk on every load/replay, so this is
+        # straight-line positional construction: one .get per optional key
+        # and no kwargs dict build.
+        get = payload.get
+        valid = payload["valid_window"]
+        tx_payload = get("tx_window")
+        time_granularity = get("time_granularity")
         return cls(
-            chunk_id=payload["chunk_id"],
-            doc_id=payload["doc_id"],
-            text=payload["text"],
-            uri=payload["uri"],
-            authority=payload["authority"],
-            valid_window=TimeWindow(
-                start=_parse_ts(payload["valid_window"]["start"]),
-                end=_parse_ts(payload["valid_window"]["end"]),
-            ),
-            tx_window=TimeWindow(
-                start=_parse_ts(tx_payload["start"]),
-                end=_parse_ts(tx_payload["end"]),
-            )
+            payload["chunk_id"],
+            _intern(payload["doc_id"]),
+            payload["text"],
+            _intern(payload["uri"]),
+            payload["authority"],
+            TimeWindow(start=_parse_ts(valid["start"]), end=_parse_ts(valid["end"])),
+            TimeWindow(start=_parse_ts(tx_payload["start"]), end=_parse_ts(tx_payload["end"]))
             if tx_payload
             else None,
-            external_id=payload.get("external_id"),
-            version_id=payload.get("version_id"),
-            facets=payload.get("facets", {}),
-            entities=payload.get("entities", []),
-            tags=payload.get("tags", []),
-            units=payload.get("units", []),
-            time_granularity=payload.get("time_granularity"),
-            time_sigma_days=payload.get("time_sigma_days"),
-            embedding=payload.get("embedding"),
-            extra=payload.get("extra", {}),
+            get("external_id"),
+            get("version_id"),
+            _intern_map(get("facets", {})),
+            _intern_list(get("entities", [])),
+            _intern_list(get("tags", [])),
+            _intern_list(get("units", [])),
+            _intern(time_granularity) if time_granularity else None,
+            get("time_sigma_days"),
+            _decode_embedding(get("embedding")),
+            get("extra", {}),
         )
 
 
+@lru_cache(maxsize=65536)
 def _parse_ts(value: str) -> dt.datetime:
+    """Parse an ISO timestamp, memoized: window bounds in a snapshot repeat
+    heavily (same day boundaries across chunks), so repeats collapse to a
+    dict lookup instead of a fromisoformat parse."""
     return dt.datetime.fromisoformat(value)
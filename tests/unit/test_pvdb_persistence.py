@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import datetime as dt
+
+from app.utils.time_windows import make_window
+from storage.pvdb.dao import PVDB
+
+MODEL_CFG = {"embeddings": {"name": "bge-base-en-v1.5"}}
+WINDOW = make_window(
+    dt.datetime(1950, 1, 1, tzinfo=dt.timezone.utc),
+    dt.datetime(1951, 1, 1, tzinfo=dt.timezone.utc),
+)
+
+
+def _ingest_samples(pvdb: PVDB, count: int = 3) -> list:
+    return [
+        pvdb.ingest_document(
+            text=f"GDP of France in {1950 + i} grew notably",
+            uri=f"sample://doc/{i}",
+            valid_window=WINDOW,
+            tx_window=None,
+            authority=0.5,
+            entities=["GDP", "Country:FRA"],
+        )
+        for i in range(count)
+    ]
+
+
+def test_snapshot_roundtrip_preserves_chunks(tmp_path):
+    path = tmp_path / "state.json"
+    pvdb = PVDB(MODEL_CFG, persist_path=path)
+    originals = _ingest_samples(pvdb)
+    pvdb.flush(force=True)
+    pvdb.drain_flushes()
+
+    reloaded = PVDB(MODEL_CFG, persist_path=path)
+    assert set(reloaded.chunks) == {chunk.chunk_id for chunk in originals}
+    for original in originals:
+        copy = reloaded.chunks[original.chunk_id]
+        assert copy.text == original.text
+        assert copy.uri == original.uri
+        assert copy.entities == original.entities
+        assert copy.valid_window.start == original.valid_window.start
+        assert copy.embedding is not None
+    # The reloaded index must answer searches without re-ingesting; querying
+    # an ingested text verbatim must return its own chunk first.
+    results = reloaded.ann_search(originals[1].text, top_k=1)
+    assert results and results[0][0].chunk_id == originals[1].chunk_id
+
+
+def test_wal_replay_recovers_unflushed_ingests(tmp_path):
+    path = tmp_path / "state.json"
+    pvdb = PVDB(MODEL_CFG, persist_path=path)
+    originals = _ingest_samples(pvdb)
+    # No snapshot flush: the write-ahead log alone must carry the state.
+    assert not path.exists()
+
+    reloaded = PVDB(MODEL_CFG, persist_path=path)
+    assert set(reloaded.chunks) == {chunk.chunk_id for chunk in originals}
+    assert all(chunk.embedding is not None for chunk in reloaded.chunks.values())
+
+
+def test_wal_replay_tolerates_torn_tail(tmp_path):
+    path = tmp_path / "state.json"
+    pvdb = PVDB(MODEL_CFG, persist_path=path)
+    originals = _ingest_samples(pvdb)
+    # Simulate a crash mid-append: a truncated line at the end of the log.
+    with pvdb._log_path.open("ab") as handle:
+        handle.write(b'{"op": "upsert_chunk", "rec')
+
+    reloaded = PVDB(MODEL_CFG, persist_path=path)
+    assert set(reloaded.chunks) == {chunk.chunk_id for chunk in originals}
+
+
+def test_flush_compacts_log_and_keeps_state(tmp_path):
+    path = tmp_path / "state.json"
+    pvdb = PVDB(MODEL_CFG, persist_path=path)
+    originals = _ingest_samples(pvdb)
+    assert pvdb._log_path.stat().st_size > 0
+    pvdb.flush(force=True)
+    pvdb.drain_flushes()
+    # Snapshot write compacts the log away; reload sees identical chunks.
+    assert not pvdb._log_path.exists() or pvdb._log_path.stat().st_size == 0
+
+    reloaded = PVDB(MODEL_CFG, persist_path=path)
+    assert set(reloaded.chunks) == {chunk.chunk_id for chunk in originals}
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import json
+
+from pydantic import TypeAdapter
+
+from app.schemas.answer import AnswerResponse
+
+SAMPLE_RESPONSE = {
+    "answer": "GDP per capita was roughly 2000 intl$ in 1870.",
+    "attribution_card": {
+        "mode": "HARD",
+        "time_axis": "valid",
+        "window": {"from": "1865-01-01T00:00:00+00:00", "to": "1875-01-01T00:00:00+00:00"},
+        "sources": [
+            {
+                "uri": "oecd-maddison",
+                "quote": "Europe's GDP per capita in 1870...",
+                "interval": {"from": "1870-01-01T00:00:00+00:00", "to": "1871-01-01T00:00:00+00:00"},
+                "score": 0.91,
+            }
+        ],
+        "temporal_confidence": {
+            "level": "HIGH",
+            "reasons": ["single_authoritative_source"],
+            "alternative_windows": [],
+        },
+        "counterfactuals": [],
+    },
+    "controller_stats": {
+        "hops_used": 1,
+        "signals": {"coverage": 0.8, "authority": 0.9},
+        "latency_ms": 12,
+        "cost_usd": 0.0,
+        "tokens_in": 8,
+        "tokens_out": 40,
+        "degraded": None,
+        "rerank_method": "ce",
+    },
+    "audit_trail": [],
+    "evidence_only": False,
+    "reason": None,
+}
+
+
+def test_model_construct_serializes_like_full_validation():
+    """Routes serialize model_construct output; it must match validated output."""
+    adapter = TypeAdapter(AnswerResponse)
+    validated = json.loads(adapter.dump_json(adapter.validate_python(SAMPLE_RESPONSE)))
+    constructed = json.loads(
+        adapter.dump_json(AnswerResponse.model_construct(**SAMPLE_RESPONSE), warnings=False)
+    )
+    assert constructed == validated